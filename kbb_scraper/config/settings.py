@@ -3,6 +3,7 @@ Configuration settings for KBB Research Scraper - UV compatible
 """
 
 
+import os
 import sys
 from pathlib import Path
 # Get the package root directory (where pyproject.toml is)
@@ -56,6 +57,9 @@ SPEC_CATEGORIES = {
     'pricing': ['MSRP', 'Invoice', 'Resale Value', 'Price Range']
 }
 
+# Browser user agent, shared by Selenium and plain HTTP requests
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
 # Selenium settings
 SELENIUM_CONFIG = {
     'implicit_wait': 10,
@@ -69,10 +73,22 @@ SELENIUM_CONFIG = {
         '--disable-gpu',
         '--window-size=1920,1080',
         '--disable-blink-features=AutomationControlled',
-        '--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        f'--user-agent={USER_AGENT}'
     ]
 }
 
+# Plain HTTP settings for server-rendered pages (reviews) fetched without a browser
+HTTP_CONFIG = {
+    'headers': {
+        'User-Agent': USER_AGENT,
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.9',
+    },
+    'timeout': 30,
+    'pool_connections': 10,
+    'pool_maxsize': 10,
+}
+
 # Logging configuration
 LOGGING_CONFIG = {
     'version': 1,
@@ -136,6 +152,7 @@ RESEARCH_CONFIG = {
     'save_combined_data': True,
     'data_format': 'csv',  # or 'json', 'parquet'
     'include_timestamp': True,
+    'save_raw_json': True,  # write a .raw.json copy next to each body type file
     'max_retries': 3,
     'delay_between_requests': 2,  # seconds
     'request_timeout': 30,
@@ -143,6 +160,19 @@ RESEARCH_CONFIG = {
     'cache_expiry_hours': 24,
 }
 
+# Minimum seconds between requests to one host, shared by every scraper in the
+# process. Override with the SCRAPER_RATE_LIMIT_DELAY environment variable.
+RATE_LIMIT_DELAY = float(os.environ.get(
+    'SCRAPER_RATE_LIMIT_DELAY', RESEARCH_CONFIG['delay_between_requests']
+))
+# Requests allowed back-to-back before the delay applies (e.g. the two review pages)
+RATE_LIMIT_BURST = 2
+
+# Fold each {make}_{model}_reviews.ndjson log into its _reviews.json when the
+# reviews scraper closes. run_parallel sets SCRAPER_COMPACT_REVIEWS=0 so worker
+# logs stay NDJSON and can be merged by plain concatenation.
+COMPACT_REVIEWS_ON_CLOSE = os.environ.get('SCRAPER_COMPACT_REVIEWS', '1') != '0'
+
 # Cache settings
 CACHE_CONFIG = {
     'enabled': True,
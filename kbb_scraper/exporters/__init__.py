@@ -2,6 +2,6 @@
 Exporters package for outputting transformed data.
 """
 from .db_exporter import DatabaseExporter
-from .csv_exporter import CsvExporter
+from .csv_exporter import CsvExporter, CsvRowSink
 
-__all__ = ["DatabaseExporter", "CsvExporter"]
+__all__ = ["DatabaseExporter", "CsvExporter", "CsvRowSink"]
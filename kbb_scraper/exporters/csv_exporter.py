@@ -5,7 +5,7 @@ import csv
 import logging
 import re
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 from kbb_scraper.parsers.value_parser import (
     parse_fuel_economy,
@@ -60,14 +60,14 @@ FIXED_COLUMNS = [
     "Stability Control",
 ]
 
-FIXED_SET = set(FIXED_COLUMNS)
+FIXED_SET = frozenset(FIXED_COLUMNS)
 
 # Labels that are known to be intentionally unmapped (not warnings)
-_KNOWN_UNMAPPED = {
+_KNOWN_UNMAPPED = frozenset({
     'specifications', 'features', 'compare', 'save', 'see pricing', '',
     'fair market price', 'horsepower', 'torque', 'cargo volume',
     'curb weight', 'fuel economy',
-}
+})
 _WARNED_LABELS: set = set()  # module-level dedup so each label warns once
 
 # Detect labels that are actually trim names rather than spec/feature names.
@@ -93,11 +93,72 @@ def _is_trim_name(label: str) -> bool:
     return bool(_TRIM_NAME_RE.search(label))
 
 
+class CsvRowSink:
+    """Long-lived, buffered append handle for one CSV file.
+
+    The file is opened on the first write and the header is written only if
+    the file was new or empty.  Rows are dicts; columns missing from a row are
+    written empty and keys outside *columns* are ignored.
+    """
+
+    def __init__(self, csv_path: Path, columns: Sequence[str], buffering: int = 1 << 20):
+        self.csv_path = Path(csv_path)
+        self.columns = tuple(columns)
+        self.buffering = buffering
+        self._fh = None
+        self._writer = None
+
+    def _open(self) -> None:
+        self.csv_path.parent.mkdir(parents=True, exist_ok=True)
+        is_new = not self.csv_path.exists() or self.csv_path.stat().st_size == 0
+        self._fh = open(self.csv_path, "a", newline="", encoding="utf-8",
+                        buffering=self.buffering)
+        self._writer = csv.writer(self._fh)
+        if is_new:
+            self._writer.writerow(self.columns)
+
+    def write(self, row: Dict[str, Any]) -> None:
+        """Append one row."""
+        if self._writer is None:
+            self._open()
+        self._writer.writerow(tuple(row.get(col) for col in self.columns))
+
+    def write_many(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """Append several rows."""
+        if self._writer is None:
+            self._open()
+        columns = self.columns
+        self._writer.writerows(tuple(row.get(col) for col in columns) for row in rows)
+
+    def flush(self) -> None:
+        if self._fh is not None:
+            self._fh.flush()
+
+    def close(self) -> None:
+        """Flush buffered rows and close the file."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
 class CsvExporter:
-    """Flatten one scrape result and append it to a single CSV file."""
+    """Flatten one scrape result and append it to a single CSV file.
+
+    Keep one instance per run: the dedup keys are read from the existing CSV
+    once and rows go through a buffered sink that is flushed on ``close()``.
+    """
 
     def __init__(self, csv_path: Path):
         self.csv_path = csv_path
+        self._existing_keys: Optional[set] = None
+        self._sink = CsvRowSink(csv_path, FIXED_COLUMNS)
 
     # ------------------------------------------------------------------
     # public
@@ -210,9 +271,9 @@ class CsvExporter:
 
     def append_to_csv(self, rows: List[Dict[str, Any]]) -> None:
         """Append *rows* to the CSV file, skipping duplicates."""
-        self.csv_path.parent.mkdir(parents=True, exist_ok=True)
-
-        existing_keys = self._load_existing_keys()
+        if self._existing_keys is None:
+            self._existing_keys = self._load_existing_keys()
+        existing_keys = self._existing_keys
         new_rows = []
         skipped = 0
 
@@ -231,14 +292,16 @@ class CsvExporter:
             logger.info("No new rows to append (all duplicates)")
             return
 
-        file_exists = self.csv_path.exists()
-        with open(self.csv_path, "a", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(
-                f, fieldnames=FIXED_COLUMNS, extrasaction="ignore"
-            )
-            if not file_exists:
-                writer.writeheader()
-            for row in new_rows:
-                writer.writerow(row)
+        self._sink.write_many(new_rows)
 
         logger.info(f"Appended {len(new_rows)} rows to {self.csv_path}")
+
+    def close(self) -> None:
+        """Flush buffered rows to disk."""
+        self._sink.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -4,14 +4,18 @@ Main script for KBB research data collection - Fixed summary logging
 """
 import argparse
 import logging
+import os
 import sys
 import time
 import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import util as mp_util
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from kbb_scraper.scrapers.kbb_scraper import KBBResearchScraper
 from kbb_scraper.scrapers.reviews_scraper import KBBReviewsScraper
 from kbb_scraper.utils.helpers import setup_logging, extract_car_info_from_url
+from kbb_scraper.utils.rate_limiter import set_rate_share
 from kbb_scraper.config import settings, get_scrape_combinations, get_stats
 
 logger = setup_logging()
@@ -23,6 +27,9 @@ DRIVER_RESTART_INTERVAL = 100
 MAX_RETRIES = 2
 RETRY_BASE_DELAY = 10  # seconds — doubles on each retry
 
+# Upper bound on parallel browsers (--workers), to stay under KBB's rate tolerance
+MAX_WORKERS = 6
+
 def validate_and_summarize_results(results: Dict[str, Any], make: str, model: str, year: str) -> bool:
     """Validate scraped data and print summary - FIXED"""
     if not results:
@@ -144,8 +151,8 @@ def export_to_4table_format(results: Dict[str, Any], make: str, model: str, year
 
 def scrape_reviews_for_model(driver, make: str, model: str, year: str):
     """Scrape consumer reviews and expert review using an existing WebDriver session."""
+    reviews_scraper = KBBReviewsScraper(driver=driver)
     try:
-        reviews_scraper = KBBReviewsScraper(driver=driver)
         review_data = reviews_scraper.scrape_reviews(make, model, year)
 
         has_consumer = review_data.consumer_review is not None
@@ -162,6 +169,9 @@ def scrape_reviews_for_model(driver, make: str, model: str, year: str):
         logger.error(f"Traceback: {traceback.format_exc()}")
         return None
 
+    finally:
+        reviews_scraper.close()
+
 
 def scrape_single_model_with_reviews(make: str, model: str, year: str, headless: bool = True):
     """Scrape specifications AND reviews for a single car model in one browser session."""
@@ -198,9 +208,11 @@ def _is_driver_alive(scraper) -> bool:
         return False
 
 
-def _recreate_scraper(scraper, headless, with_reviews):
+def _recreate_scraper(scraper, reviews_scraper, headless, with_reviews):
     """Recreate scraper (and optionally reviews scraper) after a driver crash."""
     try:
+        if reviews_scraper:
+            reviews_scraper.close()
         scraper.close()
     except Exception:
         pass
@@ -211,6 +223,149 @@ def _recreate_scraper(scraper, headless, with_reviews):
     return new_scraper, new_reviews
 
 
+# ---------------------------------------------------------------------------
+# Parallel batch (--workers): one browser per pool process, writes in the parent
+# ---------------------------------------------------------------------------
+
+_worker_scraper = None
+_worker_finalizer = None
+_worker_headless = True
+_worker_models_since_restart = 0
+
+
+def _start_worker_scraper():
+    """Start this pool process's browser; it is closed when the process exits."""
+    global _worker_scraper, _worker_finalizer, _worker_models_since_restart
+    _worker_scraper = KBBResearchScraper(headless=_worker_headless)
+    _worker_models_since_restart = 0
+    _worker_finalizer = mp_util.Finalize(_worker_scraper, _worker_scraper.close, exitpriority=10)
+
+
+def _init_worker(headless: bool, rate_share: int):
+    """ProcessPoolExecutor initializer.
+
+    Each process gets 1/*rate_share* of the configured KBB request rate, so
+    all of them together stay within ``settings.RATE_LIMIT_DELAY``.
+    """
+    global _worker_headless
+    _worker_headless = headless
+    set_rate_share(rate_share)
+    _start_worker_scraper()
+
+
+def _restart_worker_scraper():
+    try:
+        # Calling the finalizer closes the scraper and unregisters it
+        _worker_finalizer()
+    except Exception:
+        pass
+    logger.warning("Recreating WebDriver...")
+    _start_worker_scraper()
+
+
+def scrape_one(task: Tuple[str, str, str]) -> Optional[Dict[str, Any]]:
+    """Scrape one (make, model, year) in a pool process, with the batch retry policy.
+
+    Nothing is saved here; the validated result is returned to the parent.
+    """
+    global _worker_models_since_restart
+    make, model, year = task
+
+    # Periodic driver restart to prevent memory leaks
+    _worker_models_since_restart += 1
+    if _worker_models_since_restart >= DRIVER_RESTART_INTERVAL:
+        _restart_worker_scraper()
+
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            if attempt > 0:
+                delay = RETRY_BASE_DELAY * (2 ** (attempt - 1))
+                logger.info(f"  Retry {attempt}/{MAX_RETRIES} for {year} {make} {model} "
+                            f"(waiting {delay}s)")
+                time.sleep(delay)
+                if not _is_driver_alive(_worker_scraper):
+                    _restart_worker_scraper()
+
+            result = _worker_scraper.scrape_car_model(make, model, year, save=False)
+
+            if result.get('blocked'):
+                logger.warning(f"  Blocked on attempt {attempt + 1} — backing off longer")
+                time.sleep(30 * (attempt + 1))
+                continue
+
+            if validate_and_summarize_results(result, make, model, year):
+                return result
+
+        except Exception as e:
+            logger.error(f"Failed to scrape {year} {make} {model} (attempt {attempt + 1}): {e}")
+            if not _is_driver_alive(_worker_scraper):
+                _restart_worker_scraper()
+
+    return None
+
+
+def _resolve_workers(requested: int) -> int:
+    """0 means auto: one browser per CPU, capped at MAX_WORKERS."""
+    if requested <= 0:
+        return min(os.cpu_count() or 1, MAX_WORKERS)
+    return requested
+
+
+def run_parallel_batch(tasks: List[Tuple[str, str, str]], workers: int, headless: bool,
+                       with_reviews: bool, db_output_dir: Optional[Path]) -> Tuple[int, List[str]]:
+    """Scrape *tasks* across *workers* browser processes.
+
+    Results come back to this process, which does all CSV, 4-table and review
+    writing so no two processes ever append to the same file.
+
+    Returns:
+        (number of successful models, list of failed "year make model" labels)
+    """
+    from kbb_scraper.exporters.csv_exporter import CsvExporter
+
+    logger.info(f"Scraping {len(tasks)} models with {workers} worker processes")
+    successful = 0
+    failed_models = []
+    exporter = CsvExporter(Path(settings.CSV_DATA_DIR) / "all_cars.csv")
+    # The workers, and this process when it scrapes reviews, split one KBB
+    # request budget
+    rate_share = workers + (1 if with_reviews else 0)
+    if with_reviews:
+        set_rate_share(rate_share)
+    reviews_scraper = KBBReviewsScraper(headless=headless) if with_reviews else None
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(headless, rate_share)) as pool:
+            futures = {pool.submit(scrape_one, task): task for task in tasks}
+            for i, future in enumerate(as_completed(futures), 1):
+                make, model, year = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Worker failed on {year} {make} {model}: {e}")
+                    result = None
+
+                if not result:
+                    logger.warning(f"[{i}/{len(tasks)}] Failed {year} {make} {model}")
+                    failed_models.append(f"{year} {make} {model}")
+                    continue
+
+                logger.info(f"[{i}/{len(tasks)}] Scraped {year} {make} {model}")
+                successful += 1
+                exporter.export(result)
+                if db_output_dir:
+                    export_to_4table_format(result, make, model, year, db_output_dir)
+                if reviews_scraper:
+                    reviews_scraper.scrape_reviews(make, model, year)
+    finally:
+        exporter.close()
+        if reviews_scraper:
+            reviews_scraper.close()
+
+    return successful, failed_models
+
+
 def _warn_if_onedrive():
     """Warn if the project is running from an OneDrive-synced directory."""
     cwd = str(Path.cwd()).lower()
@@ -243,6 +398,12 @@ def main():
                        help='Run with full dictionary (38 brands, 412 models, 25 years = 10,300 combinations)')
     parser.add_argument('--with-reviews', action='store_true',
                        help='Also scrape consumer reviews and expert review/recommendations')
+    parser.add_argument('--workers', type=int, default=1,
+                       help=f'Browser processes for --batch-file/--test/--batch '
+                            f'(0 = one per CPU, up to {MAX_WORKERS}; default 1). '
+                            f'All processes share one KBB request rate '
+                            f'(SCRAPER_RATE_LIMIT_DELAY), so more workers do not '
+                            f'mean more requests per second')
 
     args = parser.parse_args()
 
@@ -316,88 +477,107 @@ def main():
         successful = 0
         failed = 0
         failed_models = []
-        models_since_restart = 0
 
-        scraper = KBBResearchScraper(headless=headless)
-        reviews_scraper = KBBReviewsScraper(driver=scraper.driver) if args.with_reviews else None
-
-        try:
-            for i, model_info in enumerate(models, 1):
-                make = model_info.get('make')
-                model = model_info.get('model')
-                year = model_info.get('year')
-
-                if not all([make, model, year]):
+        workers = _resolve_workers(args.workers)
+        if workers > 1:
+            tasks = []
+            for model_info in models:
+                task = (model_info.get('make'), model_info.get('model'), model_info.get('year'))
+                if all(task):
+                    tasks.append(task)
+                else:
                     logger.warning(f"Skipping invalid model info: {model_info}")
                     failed += 1
-                    continue
-
-                # Periodic driver restart to prevent memory leaks
-                models_since_restart += 1
-                if models_since_restart >= DRIVER_RESTART_INTERVAL:
-                    logger.info(f"Restarting driver after {DRIVER_RESTART_INTERVAL} models (memory cleanup)")
-                    scraper, reviews_scraper = _recreate_scraper(
-                        scraper, headless, args.with_reviews
-                    )
-                    models_since_restart = 0
-
-                logger.info(f"[{i}/{len(models)}] Scraping {year} {make} {model}")
-
-                # Per-model retry with exponential backoff
-                model_ok = False
-                for attempt in range(MAX_RETRIES + 1):
-                    try:
-                        if attempt > 0:
-                            delay = RETRY_BASE_DELAY * (2 ** (attempt - 1))
-                            logger.info(f"  Retry {attempt}/{MAX_RETRIES} for {year} {make} {model} "
-                                        f"(waiting {delay}s)")
-                            time.sleep(delay)
+            successful, parallel_failed = run_parallel_batch(
+                tasks, workers, headless, args.with_reviews, db_output_dir
+            )
+            failed += len(parallel_failed)
+            failed_models.extend(parallel_failed)
+        else:
+            models_since_restart = 0
+
+            scraper = KBBResearchScraper(headless=headless)
+            reviews_scraper = KBBReviewsScraper(driver=scraper.driver) if args.with_reviews else None
+
+            try:
+                for i, model_info in enumerate(models, 1):
+                    make = model_info.get('make')
+                    model = model_info.get('model')
+                    year = model_info.get('year')
+
+                    if not all([make, model, year]):
+                        logger.warning(f"Skipping invalid model info: {model_info}")
+                        failed += 1
+                        continue
+
+                    # Periodic driver restart to prevent memory leaks
+                    models_since_restart += 1
+                    if models_since_restart >= DRIVER_RESTART_INTERVAL:
+                        logger.info(f"Restarting driver after {DRIVER_RESTART_INTERVAL} models (memory cleanup)")
+                        scraper, reviews_scraper = _recreate_scraper(
+                            scraper, reviews_scraper, headless, args.with_reviews
+                        )
+                        models_since_restart = 0
+
+                    logger.info(f"[{i}/{len(models)}] Scraping {year} {make} {model}")
+
+                    # Per-model retry with exponential backoff
+                    model_ok = False
+                    for attempt in range(MAX_RETRIES + 1):
+                        try:
+                            if attempt > 0:
+                                delay = RETRY_BASE_DELAY * (2 ** (attempt - 1))
+                                logger.info(f"  Retry {attempt}/{MAX_RETRIES} for {year} {make} {model} "
+                                            f"(waiting {delay}s)")
+                                time.sleep(delay)
+                                if not _is_driver_alive(scraper):
+                                    scraper, reviews_scraper = _recreate_scraper(
+                                        scraper, reviews_scraper, headless, args.with_reviews
+                                    )
+                                    models_since_restart = 0
+
+                            result = scraper.scrape_car_model(make, model, year)
+
+                            # Check if blocked — no point retrying immediately
+                            if result.get('blocked'):
+                                logger.warning(f"  Blocked on attempt {attempt + 1} — "
+                                               f"backing off longer")
+                                time.sleep(30 * (attempt + 1))
+                                continue
+
+                            if validate_and_summarize_results(result, make, model, year):
+                                successful += 1
+                                model_ok = True
+                                if args.export_db and db_output_dir:
+                                    export_to_4table_format(result, make, model, year, db_output_dir)
+                                if reviews_scraper:
+                                    reviews_scraper.scrape_reviews(make, model, year)
+                                break
+                            else:
+                                if attempt == MAX_RETRIES:
+                                    break
+                                # Might be a transient page load issue — retry
+                                continue
+
+                        except Exception as e:
+                            logger.error(f"Failed to scrape {year} {make} {model} "
+                                         f"(attempt {attempt + 1}): {e}")
                             if not _is_driver_alive(scraper):
                                 scraper, reviews_scraper = _recreate_scraper(
-                                    scraper, headless, args.with_reviews
+                                    scraper, reviews_scraper, headless, args.with_reviews
                                 )
                                 models_since_restart = 0
-
-                        result = scraper.scrape_car_model(make, model, year)
-
-                        # Check if blocked — no point retrying immediately
-                        if result.get('blocked'):
-                            logger.warning(f"  Blocked on attempt {attempt + 1} — "
-                                           f"backing off longer")
-                            time.sleep(30 * (attempt + 1))
-                            continue
-
-                        if validate_and_summarize_results(result, make, model, year):
-                            successful += 1
-                            model_ok = True
-                            if args.export_db and db_output_dir:
-                                export_to_4table_format(result, make, model, year, db_output_dir)
-                            if reviews_scraper:
-                                reviews_scraper.scrape_reviews(make, model, year)
-                            break
-                        else:
                             if attempt == MAX_RETRIES:
                                 break
-                            # Might be a transient page load issue — retry
-                            continue
-
-                    except Exception as e:
-                        logger.error(f"Failed to scrape {year} {make} {model} "
-                                     f"(attempt {attempt + 1}): {e}")
-                        if not _is_driver_alive(scraper):
-                            scraper, reviews_scraper = _recreate_scraper(
-                                scraper, headless, args.with_reviews
-                            )
-                            models_since_restart = 0
-                        if attempt == MAX_RETRIES:
-                            break
-
-                if not model_ok:
-                    failed += 1
-                    failed_models.append(f"{year} {make} {model}")
 
-        finally:
-            scraper.close()
+                    if not model_ok:
+                        failed += 1
+                        failed_models.append(f"{year} {make} {model}")
+
+            finally:
+                if reviews_scraper:
+                    reviews_scraper.close()
+                scraper.close()
 
         logger.info(f"\nBatch scraping complete:")
         logger.info(f"   Successful: {successful}/{len(models)}")
@@ -431,78 +611,88 @@ def main():
         successful = 0
         failed = 0
         failed_models = []
-        models_since_restart = 0
 
-        scraper = KBBResearchScraper(headless=headless)
-        reviews_scraper = KBBReviewsScraper(driver=scraper.driver) if args.with_reviews else None
-
-        try:
-            for i, (make, model, year) in enumerate(combinations, 1):
-                # Periodic driver restart to prevent memory leaks
-                models_since_restart += 1
-                if models_since_restart >= DRIVER_RESTART_INTERVAL:
-                    logger.info(f"Restarting driver after {DRIVER_RESTART_INTERVAL} models (memory cleanup)")
-                    scraper, reviews_scraper = _recreate_scraper(
-                        scraper, headless, args.with_reviews
-                    )
-                    models_since_restart = 0
-
-                logger.info(f"[{i}/{len(combinations)}] Scraping {year} {make} {model}")
-
-                # Per-model retry with exponential backoff
-                model_ok = False
-                for attempt in range(MAX_RETRIES + 1):
-                    try:
-                        if attempt > 0:
-                            delay = RETRY_BASE_DELAY * (2 ** (attempt - 1))
-                            logger.info(f"  Retry {attempt}/{MAX_RETRIES} for {year} {make} {model} "
-                                        f"(waiting {delay}s)")
-                            time.sleep(delay)
+        workers = _resolve_workers(args.workers)
+        if workers > 1:
+            successful, failed_models = run_parallel_batch(
+                combinations, workers, headless, args.with_reviews, db_output_dir
+            )
+            failed = len(failed_models)
+        else:
+            models_since_restart = 0
+
+            scraper = KBBResearchScraper(headless=headless)
+            reviews_scraper = KBBReviewsScraper(driver=scraper.driver) if args.with_reviews else None
+
+            try:
+                for i, (make, model, year) in enumerate(combinations, 1):
+                    # Periodic driver restart to prevent memory leaks
+                    models_since_restart += 1
+                    if models_since_restart >= DRIVER_RESTART_INTERVAL:
+                        logger.info(f"Restarting driver after {DRIVER_RESTART_INTERVAL} models (memory cleanup)")
+                        scraper, reviews_scraper = _recreate_scraper(
+                            scraper, reviews_scraper, headless, args.with_reviews
+                        )
+                        models_since_restart = 0
+
+                    logger.info(f"[{i}/{len(combinations)}] Scraping {year} {make} {model}")
+
+                    # Per-model retry with exponential backoff
+                    model_ok = False
+                    for attempt in range(MAX_RETRIES + 1):
+                        try:
+                            if attempt > 0:
+                                delay = RETRY_BASE_DELAY * (2 ** (attempt - 1))
+                                logger.info(f"  Retry {attempt}/{MAX_RETRIES} for {year} {make} {model} "
+                                            f"(waiting {delay}s)")
+                                time.sleep(delay)
+                                if not _is_driver_alive(scraper):
+                                    scraper, reviews_scraper = _recreate_scraper(
+                                        scraper, reviews_scraper, headless, args.with_reviews
+                                    )
+                                    models_since_restart = 0
+
+                            result = scraper.scrape_car_model(make, model, year)
+
+                            # Check if blocked
+                            if result.get('blocked'):
+                                logger.warning(f"  Blocked on attempt {attempt + 1} — "
+                                               f"backing off longer")
+                                time.sleep(30 * (attempt + 1))
+                                continue
+
+                            if validate_and_summarize_results(result, make, model, year):
+                                successful += 1
+                                model_ok = True
+                                if args.export_db and db_output_dir:
+                                    export_to_4table_format(result, make, model, year, db_output_dir)
+                                if reviews_scraper:
+                                    reviews_scraper.scrape_reviews(make, model, year)
+                                break
+                            else:
+                                if attempt == MAX_RETRIES:
+                                    break
+                                continue
+
+                        except Exception as e:
+                            logger.error(f"Failed to scrape {year} {make} {model} "
+                                         f"(attempt {attempt + 1}): {e}")
                             if not _is_driver_alive(scraper):
                                 scraper, reviews_scraper = _recreate_scraper(
-                                    scraper, headless, args.with_reviews
+                                    scraper, reviews_scraper, headless, args.with_reviews
                                 )
                                 models_since_restart = 0
-
-                        result = scraper.scrape_car_model(make, model, year)
-
-                        # Check if blocked
-                        if result.get('blocked'):
-                            logger.warning(f"  Blocked on attempt {attempt + 1} — "
-                                           f"backing off longer")
-                            time.sleep(30 * (attempt + 1))
-                            continue
-
-                        if validate_and_summarize_results(result, make, model, year):
-                            successful += 1
-                            model_ok = True
-                            if args.export_db and db_output_dir:
-                                export_to_4table_format(result, make, model, year, db_output_dir)
-                            if reviews_scraper:
-                                reviews_scraper.scrape_reviews(make, model, year)
-                            break
-                        else:
                             if attempt == MAX_RETRIES:
                                 break
-                            continue
-
-                    except Exception as e:
-                        logger.error(f"Failed to scrape {year} {make} {model} "
-                                     f"(attempt {attempt + 1}): {e}")
-                        if not _is_driver_alive(scraper):
-                            scraper, reviews_scraper = _recreate_scraper(
-                                scraper, headless, args.with_reviews
-                            )
-                            models_since_restart = 0
-                        if attempt == MAX_RETRIES:
-                            break
-
-                if not model_ok:
-                    failed += 1
-                    failed_models.append(f"{year} {make} {model}")
 
-        finally:
-            scraper.close()
+                    if not model_ok:
+                        failed += 1
+                        failed_models.append(f"{year} {make} {model}")
+
+            finally:
+                if reviews_scraper:
+                    reviews_scraper.close()
+                scraper.close()
 
         logger.info(f"\n=== {mode_name} Batch Scraping Complete ===")
         logger.info(f"   Successful: {successful}/{len(combinations)}")
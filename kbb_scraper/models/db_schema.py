@@ -12,7 +12,7 @@ from typing import Optional, List, Dict, Any
 import json
 
 
-@dataclass
+@dataclass(slots=True)
 class Vehicle:
     """Core vehicle identification table."""
     vehicle_id: int
@@ -32,7 +32,7 @@ class Vehicle:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class VehicleSpecs:
     """Numeric specifications table."""
     vehicle_id: int
@@ -53,7 +53,7 @@ class VehicleSpecs:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class VehicleFeatures:
     """Boolean features table."""
     vehicle_id: int
@@ -72,7 +72,7 @@ class VehicleFeatures:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class VehicleScores:
     """Rating scores table (placeholder - not scraped)."""
     vehicle_id: int
@@ -103,6 +103,14 @@ class FourTableDataset:
         self.features.append(features)
         self.scores.append(scores)
 
+    def add_vehicles(self, vehicles: List[Vehicle], specs: List[VehicleSpecs],
+                     features: List[VehicleFeatures], scores: List[VehicleScores]):
+        """Add several complete vehicle records at once (parallel lists)."""
+        self.vehicles.extend(vehicles)
+        self.specs.extend(specs)
+        self.features.extend(features)
+        self.scores.extend(scores)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary with table structure for JSON export."""
         return {
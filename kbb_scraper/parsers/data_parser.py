@@ -1,14 +1,18 @@
 """
 Parses HTML data from KBB - Keep original trim names as requested
 """
-from bs4 import BeautifulSoup
+from lxml import etree
 import pandas as pd
 import logging
 import re
 from typing import List, Dict, Any, Tuple
 
+from ..utils.helpers import element_text
+
 logger = logging.getLogger(__name__)
 
+_HTML_PARSER = etree.HTMLParser()
+
 
 class KBBDataParser:
     """Parses KBB specification tables - Keep original trim names"""
@@ -33,26 +37,30 @@ class KBBDataParser:
         Parse specification table HTML into structured data
         Returns: (parsed_data, trim_names) - KEEP ORIGINAL TRIM NAMES
         """
-        soup = BeautifulSoup(table_html, 'lxml')
         parsed_data = []
         trim_names = []
 
         try:
+            tree = etree.fromstring(table_html, _HTML_PARSER)
+            if tree is None:
+                logger.warning("Empty table HTML")
+                return [], []
+
             # First, extract trim names from the table headers - KEEP ORIGINAL
-            trim_names = self._extract_trim_names_raw(soup)
+            trim_names = self._extract_trim_names_raw(tree)
 
             # Parse the table rows
-            rows = soup.select("tbody tr")
-            logger.debug(f"Found {len(rows)} rows in table")
+            rows = tree.xpath("//tbody//tr")
+            logger.debug("Found %d rows in table", len(rows))
 
             for row in rows:
-                cells = row.find_all("td")
+                cells = row.xpath(".//td")
 
                 if len(cells) < 3:
                     continue  # Skip incomplete rows
 
-                spec_name = self._clean_spec_name(cells[1].get_text(strip=True))
-                values = [self._clean_value(c.get_text(strip=True)) for c in cells[2:]]
+                spec_name = self._clean_spec_name(element_text(cells[1]))
+                values = [self._clean_value(element_text(c)) for c in cells[2:]]
 
                 # Truncate values to match number of trims
                 if len(values) > len(trim_names):
@@ -82,7 +90,7 @@ class KBBDataParser:
             logger.error(f"Error parsing table data: {e}")
             return [], []
 
-    def _extract_trim_names_raw(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_trim_names_raw(self, tree) -> List[str]:
         """
         Extract trim names from table headers - KEEP ORIGINAL NAMES
         """
@@ -90,7 +98,7 @@ class KBBDataParser:
 
         try:
             # Find all header cells (th elements)
-            headers = soup.select("#compare-trim-tables thead tr th")
+            headers = tree.xpath('//*[@id="compare-trim-tables"]//thead//tr//th')
 
             if not headers:
                 logger.warning("No table headers found")
@@ -98,7 +106,7 @@ class KBBDataParser:
 
             # Skip first two columns (icon and spec name)
             for th in headers[2:]:
-                text = th.get_text(" ", strip=True)  # Use space instead of newline
+                text = element_text(th, " ")  # Use space instead of newline
 
                 # Skip empty headers
                 if not text or text.isspace():
@@ -111,9 +119,9 @@ class KBBDataParser:
                 if "See Pricing" not in text and "See Cars" not in text:
                     trim_names.append(text)
                 else:
-                    logger.debug(f"Skipping button text: {text}")
+                    logger.debug("Skipping button text: %s", text)
 
-            logger.debug(f"Extracted {len(trim_names)} raw trim names")
+            logger.debug("Extracted %d raw trim names", len(trim_names))
             return trim_names
 
         except Exception as e:
@@ -5,8 +5,29 @@ Transforms strings like "220 @ 4500 RPM" -> 220, "$9,325" -> 9325, etc.
 """
 import re
 import hashlib
+from functools import lru_cache
 from typing import Optional, Tuple
 
+# Patterns are compiled once; the parsers run once per trim per spec.
+_LEADING_INT = re.compile(r'(\d+)')
+_ZERO_TO_SIXTY = re.compile(r'([\d.]+)\s*(?:seconds?|sec)?', re.IGNORECASE)
+_TOP_SPEED = re.compile(r'(\d+)\s*(?:mph)?', re.IGNORECASE)
+# City/Hwy/Comb may appear in any order, so one scan records the first of each
+_FUEL_ECONOMY_PARTS = re.compile(
+    r'(?:(?P<city>City)|(?P<hwy>Hwy)|Comb(?:ined)?)\s*(?P<num>\d+)', re.IGNORECASE
+)
+_MPGE = re.compile(r'(\d+)\s*MPGe', re.IGNORECASE)
+_KWH_PER_100MI = re.compile(r'([\d.]+)\s*kWh\s*/\s*100\s*mi', re.IGNORECASE)
+_SIMPLE_MPG = re.compile(r'(\d+)\s*(?:mpg)\b', re.IGNORECASE)
+_BARE_INT = re.compile(r'^(\d+)$')
+_WEIGHT = re.compile(r'([\d,]+)\s*(?:pounds?|lbs?)?', re.IGNORECASE)
+_DIMENSION = re.compile(r'([\d.]+)\s*(?:inches?|in\.?|feet|ft\.?)?', re.IGNORECASE)
+_VOLUME = re.compile(r'([\d.]+)\s*(?:cu\.?\s*ft\.?|cubic\s*feet|gallons?|gal\.?)?',
+                     re.IGNORECASE)
+_PRICE_STRIP = re.compile(r'[$,]')
+_LEADING_DECIMAL = re.compile(r'([\d.]+)')
+_SAVE_PREFIX = re.compile(r'^Save\s+\d+\s+of\s+\d+\s+')
+
 
 def parse_horsepower(value: str) -> Optional[int]:
     """
@@ -18,7 +39,7 @@ def parse_horsepower(value: str) -> Optional[int]:
         return None
 
     # Match pattern: number optionally followed by @ RPM info
-    match = re.match(r'(\d+)', value.strip())
+    match = _LEADING_INT.match(value.strip())
     if match:
         return int(match.group(1))
     return None
@@ -34,7 +55,7 @@ def parse_torque(value: str) -> Optional[int]:
         return None
 
     # Match pattern: number at start (optionally followed by lb-ft or @ RPM)
-    match = re.match(r'(\d+)', value.strip())
+    match = _LEADING_INT.match(value.strip())
     if match:
         return int(match.group(1))
     return None
@@ -50,7 +71,7 @@ def parse_zero_to_sixty(value: str) -> Optional[float]:
         return None
 
     # Match pattern: decimal number followed by optional seconds/sec
-    match = re.match(r'([\d.]+)\s*(?:seconds?|sec)?', value.strip(), re.IGNORECASE)
+    match = _ZERO_TO_SIXTY.match(value.strip())
     if match:
         try:
             return float(match.group(1))
@@ -69,12 +90,13 @@ def parse_top_speed(value: str) -> Optional[int]:
         return None
 
     # Match pattern: number followed by optional mph
-    match = re.match(r'(\d+)\s*(?:mph)?', value.strip(), re.IGNORECASE)
+    match = _TOP_SPEED.match(value.strip())
     if match:
         return int(match.group(1))
     return None
 
 
+@lru_cache(maxsize=4096)
 def parse_fuel_economy(value: str) -> Tuple[Optional[int], Optional[int], Optional[int]]:
     """
     Parse fuel economy from strings like "City 26/Hwy 35/Comb 29 MPG".
@@ -94,28 +116,30 @@ def parse_fuel_economy(value: str) -> Tuple[Optional[int], Optional[int], Option
     city, highway, combined = None, None, None
 
     # Pattern 1: "City XX/Hwy YY/Comb ZZ MPG(e)"
-    city_match = re.search(r'City\s*(\d+)', value, re.IGNORECASE)
-    hwy_match = re.search(r'Hwy\s*(\d+)', value, re.IGNORECASE)
-    comb_match = re.search(r'Comb(?:ined)?\s*(\d+)', value, re.IGNORECASE)
-
-    if city_match:
-        city = int(city_match.group(1))
-    if hwy_match:
-        highway = int(hwy_match.group(1))
-    if comb_match:
-        combined = int(comb_match.group(1))
+    for match in _FUEL_ECONOMY_PARTS.finditer(value):
+        num = int(match.group('num'))
+        if match.group('city'):
+            if city is None:
+                city = num
+        elif match.group('hwy'):
+            if highway is None:
+                highway = num
+        elif combined is None:
+            combined = num
 
     if city is not None or highway is not None or combined is not None:
         return (city, highway, combined)
 
+    stripped = value.strip()
+
     # Pattern 2: "XX MPGe" (electric equivalent)
-    mpge_match = re.match(r'(\d+)\s*MPGe', value.strip(), re.IGNORECASE)
+    mpge_match = _MPGE.match(stripped)
     if mpge_match:
         combined = int(mpge_match.group(1))
         return (None, None, combined)
 
     # Pattern 3: "XX kWh/100 mi" -> approximate MPGe (33.7 kWh per gallon-equivalent)
-    kwh_match = re.match(r'([\d.]+)\s*kWh\s*/\s*100\s*mi', value.strip(), re.IGNORECASE)
+    kwh_match = _KWH_PER_100MI.match(stripped)
     if kwh_match:
         kwh_per_100mi = float(kwh_match.group(1))
         if kwh_per_100mi > 0:
@@ -123,13 +147,13 @@ def parse_fuel_economy(value: str) -> Tuple[Optional[int], Optional[int], Option
             return (None, None, combined)
 
     # Pattern 4: Simple "XX MPG" (assume combined)
-    simple_match = re.match(r'(\d+)\s*(?:mpg)\b', value.strip(), re.IGNORECASE)
+    simple_match = _SIMPLE_MPG.match(stripped)
     if simple_match:
         combined = int(simple_match.group(1))
         return (city, highway, combined)
 
     # Pattern 5: bare number (only if clearly numeric and reasonable for MPG)
-    bare_match = re.match(r'^(\d+)$', value.strip())
+    bare_match = _BARE_INT.match(stripped)
     if bare_match:
         num = int(bare_match.group(1))
         if 5 <= num <= 200:
@@ -148,7 +172,7 @@ def parse_weight(value: str) -> Optional[int]:
         return None
 
     # Match pattern: number followed by optional pounds/lbs
-    match = re.match(r'([\d,]+)\s*(?:pounds?|lbs?)?', value.strip(), re.IGNORECASE)
+    match = _WEIGHT.match(value.strip())
     if match:
         # Remove commas from number
         num_str = match.group(1).replace(',', '')
@@ -169,7 +193,7 @@ def parse_dimension(value: str) -> Optional[float]:
         return None
 
     # Match pattern: decimal number followed by optional unit
-    match = re.match(r'([\d.]+)\s*(?:inches?|in\.?|feet|ft\.?)?', value.strip(), re.IGNORECASE)
+    match = _DIMENSION.match(value.strip())
     if match:
         try:
             return float(match.group(1))
@@ -188,8 +212,7 @@ def parse_volume(value: str) -> Optional[float]:
         return None
 
     # Match pattern: decimal number followed by optional unit
-    match = re.match(r'([\d.]+)\s*(?:cu\.?\s*ft\.?|cubic\s*feet|gallons?|gal\.?)?',
-                     value.strip(), re.IGNORECASE)
+    match = _VOLUME.match(value.strip())
     if match:
         try:
             return float(match.group(1))
@@ -208,10 +231,10 @@ def parse_price(value: str) -> Optional[int]:
         return None
 
     # Remove $ and commas, then parse
-    cleaned = re.sub(r'[$,]', '', value.strip())
+    cleaned = _PRICE_STRIP.sub('', value.strip())
 
     # Match number (possibly with decimal)
-    match = re.match(r'([\d.]+)', cleaned)
+    match = _LEADING_DECIMAL.match(cleaned)
     if match:
         try:
             # Convert to int (truncate any decimals)
@@ -244,6 +267,7 @@ def feature_to_bool(value: str) -> Optional[bool]:
         return None
 
 
+@lru_cache(maxsize=8192)
 def generate_vehicle_id(brand: str, model: str, year: int, trim: str, body_type: str) -> int:
     """
     Generate a unique vehicle ID based on composite key.
@@ -262,6 +286,7 @@ def generate_vehicle_id(brand: str, model: str, year: int, trim: str, body_type:
     return vehicle_id
 
 
+@lru_cache(maxsize=8192)
 def clean_trim_name(trim_name: str) -> str:
     """
     Clean trim name by removing prefixes like "Save X of Y".
@@ -272,6 +297,6 @@ def clean_trim_name(trim_name: str) -> str:
         return ""
 
     # Remove "Save X of Y " prefix
-    cleaned = re.sub(r'^Save\s+\d+\s+of\s+\d+\s+', '', trim_name.strip())
+    cleaned = _SAVE_PREFIX.sub('', trim_name.strip())
 
     return cleaned.strip()
@@ -2,14 +2,62 @@
 Detects and categorizes body types from KBB tabs - Improved for BMW issue
 """
 import re
+from functools import lru_cache
 from typing import List, Dict, Tuple, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# BMW-specific tab patterns, checked before the generic mapping.
+# Flattened to (keyword, body_type) pairs so detection is a single linear scan.
+_BMW_KEYWORDS: Tuple[Tuple[str, str], ...] = (
+    ('wagon', 'wagon'),
+    ('touring', 'wagon'),
+    ('sportwagon', 'wagon'),
+    ('gran turismo', 'sedan'),
+    ('gt', 'sedan'),
+    ('gran coupe', 'sedan'),
+    ('4 series gran coupe', 'sedan'),
+)
+
+# Common trim-level names, matched as whole words (so 'le' doesn't hit 'sale')
+_RE_TRIM = re.compile(r'\b(?:xle|limited|premium|sport|le|se)\b')
+
+_SANITIZE_TABLE = str.maketrans({' ': '_'})
+
+
+@lru_cache(maxsize=1024)
+def _sanitize(name: str) -> str:
+    """Lowercase a make/model name and replace spaces with underscores"""
+    return name.lower().translate(_SANITIZE_TABLE)
+
+
+@lru_cache(maxsize=1024)
+def _sorted_tokens(tab_name: str) -> Tuple[str, ...]:
+    """Unique lowercase words of a tab name, sorted for merge-based comparison"""
+    return tuple(sorted(set(tab_name.lower().split())))
+
+
+def _count_common(a: Tuple[str, ...], b: Tuple[str, ...]) -> int:
+    """Count tokens shared by two sorted, de-duplicated token tuples"""
+    i = j = common = 0
+    while i < len(a) and j < len(b):
+        if a[i] == b[j]:
+            common += 1
+            i += 1
+            j += 1
+        elif a[i] < b[j]:
+            i += 1
+        else:
+            j += 1
+    return common
+
+
 class BodyTypeDetector:
     """Detects body types from tab names - FIXED for BMW issue"""
 
+    __slots__ = ('body_type_mapping', '_flat_keywords', 'detected_bodytypes')
+
     def __init__(self):
         self.body_type_mapping = {
             'sedan': ['sedan', 'sedans', '4 door', '4-door', '4d'],
@@ -25,6 +73,12 @@ class BodyTypeDetector:
             'performance': ['m performance', 'amg', 's line', 'f sport', 'type r', 'gt'],
             'default': ['default', 'standard', 'base']
         }
+        # Flattened (keyword, body_type) pairs in mapping order, built once per instance
+        self._flat_keywords: Tuple[Tuple[str, str], ...] = tuple(
+            (keyword, std_name)
+            for std_name, keywords in self.body_type_mapping.items()
+            for keyword in keywords
+        )
         self.detected_bodytypes = {}
 
     def detect_body_type(self, tab_name: str) -> str:
@@ -34,43 +88,23 @@ class BodyTypeDetector:
         """
         tab_name_lower = tab_name.lower()
 
-        # Special handling for BMW patterns
-        bmw_patterns = {
-            'wagon': [r'wagon', r'touring', r'sportwagon'],
-            'gran turismo': ['gran turismo', 'gt'],
-            'gran coupe': ['gran coupe', '4 series gran coupe'],
-        }
-
         # Check for BMW specific patterns first
-        for body_type, patterns in bmw_patterns.items():
-            for pattern in patterns:
-                if isinstance(pattern, str) and pattern in tab_name_lower:
-                    logger.debug(f"Detected BMW {body_type} from: {tab_name}")
-                    return 'wagon' if 'wagon' in body_type else 'sedan'
-                elif isinstance(pattern, str) and re.search(pattern, tab_name_lower, re.IGNORECASE):
-                    logger.debug(f"Detected BMW {body_type} from pattern: {tab_name}")
-                    return 'wagon' if 'wagon' in body_type else 'sedan'
+        for keyword, body_type in _BMW_KEYWORDS:
+            if keyword in tab_name_lower:
+                logger.debug("Detected BMW %s from: %s", body_type, tab_name)
+                return body_type
 
         # Check for specific body types in mapping
-        for std_name, keywords in self.body_type_mapping.items():
-            for keyword in keywords:
-                if keyword in tab_name_lower:
-                    logger.debug(f"Detected body type '{std_name}' from tab: {tab_name}")
-                    return std_name
-
-        # Check for numeric patterns like "4D", "2D"
-        if re.search(r'\b4d\b|\b4 door\b|\b4-door\b', tab_name_lower):
-            return 'sedan'
-        elif re.search(r'\b2d\b|\b2 door\b|\b2-door\b', tab_name_lower):
-            return 'coupe'
-        elif re.search(r'\b5d\b|\b5 door\b|\b5-door\b', tab_name_lower):
-            return 'hatchback'
+        for keyword, std_name in self._flat_keywords:
+            if keyword in tab_name_lower:
+                logger.debug("Detected body type '%s' from tab: %s", std_name, tab_name)
+                return std_name
 
         # Default based on common terms
-        if any(word in tab_name_lower for word in ['le', 'se', 'xle', 'limited', 'premium', 'sport']):
+        if _RE_TRIM.search(tab_name_lower):
             return 'sedan'  # Common trim levels usually for sedans
 
-        logger.debug(f"No body type detected, using 'default': {tab_name}")
+        logger.debug("No body type detected, using 'default': %s", tab_name)
         return 'default'
 
     def categorize_tabs(self, tab_names: List[str]) -> Dict[str, List[str]]:
@@ -107,20 +141,20 @@ class BodyTypeDetector:
         Check if a tab is a duplicate (different name but same content)
         Common in KBB where tabs might have slightly different names but same data
         """
-        new_lower = new_tab.lower()
+        new_words = _sorted_tokens(new_tab)
+        if not new_words:
+            return False
 
         for existing in existing_tabs:
-            existing_lower = existing.lower()
+            existing_words = _sorted_tokens(existing)
+            if not existing_words:
+                continue
 
-            # If tabs are very similar (85% similar words), consider duplicate
-            new_words = set(new_lower.split())
-            existing_words = set(existing_lower.split())
-
-            if len(new_words) > 0 and len(existing_words) > 0:
-                similarity = len(new_words.intersection(existing_words)) / max(len(new_words), len(existing_words))
-                if similarity > 0.7:  # 70% similar
-                    logger.debug(f"Tab '{new_tab}' appears similar to '{existing}' (similarity: {similarity:.2f})")
-                    return True
+            # If tabs are very similar (70% shared words), consider duplicate
+            similarity = _count_common(new_words, existing_words) / max(len(new_words), len(existing_words))
+            if similarity > 0.7:
+                logger.debug("Tab '%s' appears similar to '%s' (similarity: %.2f)", new_tab, existing, similarity)
+                return True
 
         return False
 
@@ -150,10 +184,8 @@ class BodyTypeDetector:
 
     def get_bodytype_filename(self, body_type: str, make: str, model: str, year: str) -> str:
         """Generate filename for a specific body type"""
-        sanitized_make = make.lower().replace(' ', '_')
-        sanitized_model = model.lower().replace(' ', '_')
+        sanitized_make = _sanitize(make)
+        sanitized_model = _sanitize(model)
+        suffix = '' if body_type == 'default' else f"_{body_type}"
 
-        if body_type == 'default':
-            return f"{sanitized_make}_{sanitized_model}_{year}_specs.csv"
-        else:
-            return f"{sanitized_make}_{sanitized_model}_{year}_{body_type}_specs.csv"
\ No newline at end of file
+        return f"{sanitized_make}_{sanitized_model}_{year}{suffix}_specs.csv"
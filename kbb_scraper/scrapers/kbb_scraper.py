@@ -1,12 +1,13 @@
 # kbb_scraper/scrapers/kbb_scraper.py
-import time
 import re
 import logging
-import traceback
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any
-from bs4 import BeautifulSoup
+from io import BytesIO
+from typing import Dict, List, Any, Optional, Tuple
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -14,6 +15,9 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
 from kbb_scraper.config import settings
 from kbb_scraper.drivers import DriverManager
+from kbb_scraper.utils.background_writer import BackgroundWriter
+from kbb_scraper.utils.helpers import element_text
+from kbb_scraper.utils.rate_limiter import get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -35,10 +39,263 @@ _BLOCK_INDICATORS = [
 ]
 
 
+# Single case-insensitive alternation so each page is scanned once
+_BLOCK_RE = re.compile("|".join(re.escape(s) for s in _BLOCK_INDICATORS), re.IGNORECASE)
+
+
 def _is_blocked(page_source: str, title: str) -> bool:
     """Return True if the page looks like a CAPTCHA / block page."""
-    combined = (title + " " + page_source[:5000]).lower()
-    return any(indicator in combined for indicator in _BLOCK_INDICATORS)
+    return (_BLOCK_RE.search(title) is not None
+            or _BLOCK_RE.search(page_source, 0, 5000) is not None)
+
+
+_WS_RE = re.compile(r'\s+')
+
+# Noise removed from (lowercased) body type labels, applied in order
+_BODY_TYPE_NOISE_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r'\(\d+\)',  # (2), (3) etc
+        r'\d+$',     # Trailing numbers
+        r'selected',
+        r'unselected',
+        r'active',
+        r'inactive',
+        r'tab',
+        r'button',
+        r'^\d+\s*',  # Leading numbers
+    )
+)
+
+# Substring -> standardized body type name, checked in order
+_BODY_TYPE_NAMES = (
+    ('sedan', 'Sedan'),
+    ('suv', 'SUV'),
+    ('coupe', 'Coupe'),
+    ('convertible', 'Convertible'),
+    ('hatchback', 'Hatchback'),
+    ('wagon', 'Wagon'),
+    ('truck', 'Truck'),
+    ('van', 'Van'),
+    ('minivan', 'Minivan'),
+    ('pickup', 'Pickup Truck'),
+    ('sport utility', 'SUV'),
+    ('4dr', '4-Door'),
+    ('2dr', '2-Door'),
+)
+
+# Only <a href> tags are needed when scanning the overview page for style links
+_A_HREF_STRAINER = SoupStrainer("a", href=True)
+
+# "Save\nX of Y\n" prefix KBB prepends to trim names
+_SAVE_PREFIX_RE = re.compile(r'^Save\s*\n?\d+\s+of\s+\d+\s*\n?', re.IGNORECASE)
+
+# Body type selectors, in order of preference
+_BODY_TYPE_XPATHS = [
+    "//div[contains(@class, 'css-17dykbp')]",
+    "//button[contains(@class, 'body-type')]",
+    "//div[contains(@class, 'bodyType')]",
+    "//button[@role='tab']",
+    "//div[@role='tab']",
+]
+
+# Name sources read from each body type element, in order of reliability
+_BODY_TYPE_NAME_SOURCES = ("aria-label", "text", "title", "data-testid", "data-value", "class")
+
+# Evaluates each XPath in arguments[0] and returns, per XPath, a list of
+# {source: value} dicts for the matching elements ("text" is the rendered text)
+_BODY_TYPE_CANDIDATES_JS = """
+return arguments[0].map(xpath => {
+    const result = document.evaluate(xpath, document, null,
+                                     XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const candidates = [];
+    for (let i = 0; i < result.snapshotLength; i++) {
+        const el = result.snapshotItem(i);
+        candidates.push({
+            'aria-label': el.getAttribute('aria-label'),
+            'text': el.innerText,
+            'title': el.getAttribute('title'),
+            'data-testid': el.getAttribute('data-testid'),
+            'data-value': el.getAttribute('data-value'),
+            'class': el.getAttribute('class'),
+        });
+    }
+    return candidates;
+});
+"""
+
+# First h3 (of the first five) longer than 5 chars, else the first table cell's text
+_CONTENT_SIGNATURE_JS = """
+const h3s = document.querySelectorAll('h3');
+for (let i = 0; i < Math.min(h3s.length, 5); i++) {
+    const text = h3s[i].innerText.trim();
+    if (text && text.length > 5) return text;
+}
+const cell = document.querySelector('table td');
+return cell ? cell.innerText.trim() : '';
+"""
+
+# Finds the tab/button for body type arguments[0] and clicks it. Candidate groups are
+# tried in order of preference: role=tab, tablist descendants, buttons, aria-label,
+# then divs by their own text. Returns 'selected' if the first match is already
+# selected, 'clicked' after clicking a visible enabled match, or null.
+_CLICK_BODY_TYPE_JS = """
+const name = arguments[0];
+const target = name.toLowerCase();
+const textHas = el => (el.textContent || '').toLowerCase().includes(target);
+const groups = [
+    () => Array.from(document.querySelectorAll('[role="tab"]')).filter(textHas),
+    () => Array.from(document.querySelectorAll('[role="tablist"] *')).filter(textHas),
+    () => Array.from(document.querySelectorAll('button')).filter(textHas),
+    () => Array.from(document.querySelectorAll('[aria-label]')).filter(el => {
+        const label = el.getAttribute('aria-label');
+        return label.includes(name) || label.includes(target);
+    }),
+    () => Array.from(document.querySelectorAll('div')).filter(el => {
+        const own = Array.from(el.childNodes).find(n => n.nodeType === Node.TEXT_NODE);
+        return own && own.nodeValue.toLowerCase().includes(target);
+    }),
+];
+for (const group of groups) {
+    for (const el of group()) {
+        if (el.getAttribute('aria-selected') === 'true') return 'selected';
+        const visible = el.offsetWidth > 0 || el.offsetHeight > 0 || el.getClientRects().length > 0;
+        if (visible && !el.disabled) {
+            el.click();
+            return 'clicked';
+        }
+    }
+}
+return null;
+"""
+
+# 'specs' once the comparison table is rendered, 'not_found' for a rendered 404 page,
+# otherwise null so WebDriverWait keeps polling
+_SPECS_PAGE_STATE_JS = """
+if (document.getElementById('compare-trim-tables')) return 'specs';
+if (document.title.includes('404')
+        || (document.body && document.body.textContent.includes('Page Not Found'))) {
+    return 'not_found';
+}
+return null;
+"""
+
+# Returns [source, innerHTML] for #compare-trim-tables ('id') or else the table with
+# the most rows ('largest'); null if the page has no tables. Row counts stay in the
+# browser so no WebElement is created for the tables that lose.
+_SPEC_TABLE_JS = """
+const byId = document.getElementById('compare-trim-tables');
+if (byId) return ['id', byId.innerHTML];
+let best = null, bestRows = -1;
+for (const t of document.querySelectorAll('table')) {
+    if (t.rows.length > bestRows) { bestRows = t.rows.length; best = t; }
+}
+return best ? ['largest', best.innerHTML] : null;
+"""
+
+# Header/action rows that are not specifications
+_SKIP_LABELS = frozenset({'specifications', 'features', 'compare', 'save', 'see pricing', ''})
+_SKIP_PREFIXES = ('save ', 'see ')
+
+# Heading texts that are never trim names, per get_trim_names() strategy
+_TRIM_CARD_SKIP = frozenset({'save', 'see pricing', 'compare', 'specifications'})
+_TRIM_HEADING_EXCLUDED = ('save', 'pricing', 'compare', 'specification', 'feature',
+                          'overview', 'review', 'research', 'price', 'msrp')
+_TRIM_HEADER_SKIP = frozenset({'save', 'see pricing', 'specifications'})
+
+# Style-page specs memoized per scraper, keyed by URL; pages with fewer specs
+# than the minimum are likely partial loads and are always re-fetched
+_STYLE_CACHE_MAX_ENTRIES = 4096
+_STYLE_CACHE_MIN_SPECS = 10
+
+# Page HTML snapshots kept per URL until the DOM may have changed
+_PAGE_CACHE_MAX_ENTRIES = 32
+
+
+def _parse_spec_row(row, first_value_only: bool) -> Optional[Dict[str, Any]]:
+    """Parse one <tr> into {'label': name, 'values': [...]}, or None to skip it."""
+    if first_value_only:
+        # Style pages: every th, then every td, anywhere in the row
+        all_cells = [*row.iter("th"), *row.iter("td")]
+    else:
+        # th/td cells in document order (KBB rows put the th label first)
+        all_cells = ([c for c in row if c.tag in ("th", "td")]
+                     or row.xpath('.//div[@role="cell"]'))
+
+    if len(all_cells) < 2:
+        return None
+
+    # One lazy pass over the cells: the first non-empty one is the spec
+    # name, and the value cells are read from where it left off
+    texts = map(element_text, all_cells)
+    spec_name = next((text for text in texts if len(text) > 1), None)
+
+    if not spec_name:
+        return None
+
+    # Skipped rows never pay for extracting their value cells
+    name_lower = spec_name.lower()
+    if name_lower in _SKIP_LABELS or name_lower.startswith(_SKIP_PREFIXES):
+        return None
+
+    if first_value_only:
+        # "N/A" also covers a name with no cells after it
+        values = [next((text for text in texts if text), "N/A")]
+    else:
+        values = [text or "N/A" for text in texts]
+
+    if not values:
+        return None
+    return {'label': spec_name, 'values': values}
+
+
+def _parse_spec_rows(table_html: str, first_value_only: bool = False) -> List[Dict[str, Any]]:
+    """Parse spec table HTML into [{'label': name, 'values': [...]}, ...].
+
+    The first non-empty cell of each row is the spec name; the remaining
+    cells are its per-trim values, with empty cells reported as "N/A".
+    With *first_value_only* (style pages) cells are every th then every td
+    in the row, with no div fallback, and each spec gets just its first
+    non-empty value; the cells after it are never read.
+    Rows are streamed with lxml's iterparse and freed once processed, so
+    wide tables are never held in memory as a full tree. Rows nested in
+    another row are parsed with it, so specs keep document order.
+    """
+    specs = []
+    if not table_html or not table_html.strip():
+        return specs
+
+    row_count = 0
+    rows = etree.iterparse(
+        BytesIO(table_html.encode("utf-8")),
+        events=("end",), tag="tr", html=True, recover=True, encoding="utf-8",
+    )
+
+    for _, top_row in rows:
+        # A nested row ends before its outer row; it is handled with the outer one
+        if next(top_row.iterancestors("tr"), None) is not None:
+            continue
+
+        try:
+            # The outer row first, then its nested rows, in document order
+            for row in top_row.iter("tr"):
+                row_count += 1
+                try:
+                    spec = _parse_spec_row(row, first_value_only)
+                except Exception:
+                    logger.debug("Error parsing row", exc_info=True)
+                    continue
+                if spec:
+                    specs.append(spec)
+
+        finally:
+            # Free the processed row and everything before it
+            top_row.clear()
+            while top_row.getprevious() is not None:
+                del top_row.getparent()[0]
+
+    logger.info("Table has %d rows total", row_count)
+    return specs
 
 
 class KBBResearchScraper:
@@ -48,7 +305,13 @@ class KBBResearchScraper:
         """Initialize the scraper using DriverManager"""
         self._driver_manager = DriverManager(headless=headless)
         self.driver = self._driver_manager.setup_driver()
-        
+        self._rate_limiter = get_rate_limiter(settings.KBB_BASE_URL)
+        self._style_cache: "OrderedDict[str, Tuple[List[str], List[str]]]" = OrderedDict()
+        self._page_cache: "OrderedDict[str, str]" = OrderedDict()
+        # Created on the first save and reused so the CSV stays open for the run
+        self._csv_exporter = None
+        self._writer = BackgroundWriter(name="kbb-writer")
+
     def navigate_to_car_model(self, make: str, model: str, year: str) -> str:
         """Navigate to the KBB page for a specific car model.
 
@@ -62,43 +325,55 @@ class KBBResearchScraper:
         logger.info(f"Navigating to: {url}")
 
         try:
+            self._rate_limiter.acquire()
+            self._page_cache.clear()
             self.driver.get(url)
-            time.sleep(3)  # Initial page load
+            # Wait for the document to finish loading instead of a fixed sleep
+            WebDriverWait(self.driver, 10).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
 
             # Check for CAPTCHA / block pages BEFORE other checks
-            if _is_blocked(self.driver.page_source, self.driver.title):
+            page_source = self._get_page_source()
+            title = self.driver.title
+            if _is_blocked(page_source, title):
                 logger.error(f"BLOCKED / CAPTCHA detected at: {url}")
                 self._save_debug_html(f"blocked_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html")
                 return "blocked"
 
             # Check if page loaded successfully
-            if "404" in self.driver.title or "Page Not Found" in self.driver.page_source:
+            if "404" in title or "Page Not Found" in page_source:
                 logger.error(f"Page not found: {url}")
                 return "not_found"
 
-            # Wait for main content to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-
             # Check if we were redirected away from /specs/
             current_url = self.driver.current_url
             if not current_url.rstrip('/').endswith('/specs'):
                 logger.info(f"Redirected to overview page: {current_url}")
                 return "overview"
 
-            # Wait for specs table to be present (primary indicator of loaded content)
+            # Wait for specs table to be present (primary indicator of loaded content),
+            # bailing out as soon as a client-rendered "not found" page appears
             try:
-                WebDriverWait(self.driver, 15).until(
-                    EC.presence_of_element_located((By.ID, "compare-trim-tables"))
+                state = WebDriverWait(self.driver, 15, poll_frequency=0.25).until(
+                    lambda d: d.execute_script(_SPECS_PAGE_STATE_JS)
                 )
-                logger.info("Specs table loaded successfully")
             except TimeoutException:
+                state = None
+            # The table rendered after the block/404 snapshot was taken
+            self._page_cache.clear()
+
+            if state == "specs":
+                logger.info("Specs table loaded successfully")
+            elif state == "not_found":
+                logger.error(f"Page not found after render: {url}")
+                return "not_found"
+            else:
                 logger.warning("compare-trim-tables not found - checking for alternative content")
                 # Check if any table exists
-                tables = self.driver.find_elements(By.TAG_NAME, "table")
-                if tables:
-                    logger.info(f"Found {len(tables)} table(s) on page")
+                table_count = self.driver.execute_script("return document.querySelectorAll('table').length;")
+                if table_count:
+                    logger.info(f"Found {table_count} table(s) on page")
                 else:
                     logger.error(f"No tables found on page - car does not exist: {year} {make} {model}")
                     return "not_found"
@@ -112,7 +387,8 @@ class KBBResearchScraper:
     def get_all_body_types(self, wait_time: int = 10) -> List[str]:
         """Get ALL available body types for the current model - FIXED"""
         body_types = []
-        
+        seen_body_types = set()
+
         try:
             # Wait for body type container
             WebDriverWait(self.driver, wait_time).until(
@@ -121,16 +397,13 @@ class KBBResearchScraper:
             
             # Find all body type elements using the class pattern from HTML
             # Looking for elements with classes like "css-17dykbp e1f04f5s0"
-            body_type_xpaths = [
-                "//div[contains(@class, 'css-17dykbp')]",
-                "//button[contains(@class, 'body-type')]",
-                "//div[contains(@class, 'bodyType')]",
-                "//button[@role='tab']",
-                "//div[@role='tab']"
-            ]
-            
-            for xpath in body_type_xpaths:
-                elements = self.driver.find_elements(By.XPATH, xpath)
+            # Evaluate every selector and read each match's name attributes in one
+            # roundtrip; results keep selector priority order
+            matches_per_xpath = self.driver.execute_script(
+                _BODY_TYPE_CANDIDATES_JS, _BODY_TYPE_XPATHS
+            ) or []
+
+            for xpath, elements in zip(_BODY_TYPE_XPATHS, matches_per_xpath):
                 if elements:
                     logger.info(f"Found {len(elements)} body type elements with xpath: {xpath}")
                     
@@ -139,12 +412,13 @@ class KBBResearchScraper:
                             # Get body type name
                             body_type = self._extract_body_type_name(element)
                             
-                            if body_type and body_type not in body_types:
+                            if body_type and body_type not in seen_body_types:
+                                seen_body_types.add(body_type)
                                 body_types.append(body_type)
-                                logger.debug(f"Found body type: {body_type}")
+                                logger.debug("Found body type: %s", body_type)
                                 
                         except Exception as e:
-                            logger.debug(f"Could not extract from element: {e}")
+                            logger.debug("Could not extract from element: %s", e)
                             continue
                     
                     if body_types:
@@ -154,25 +428,22 @@ class KBBResearchScraper:
             if not body_types:
                 logger.info("Trying alternative body type detection...")
                 
-                # Look for any clickable elements that might be body types
-                clickable_elements = self.driver.find_elements(
-                    By.XPATH, 
-                    "//div[@role='button'] | //button | //div[@tabindex]"
-                )
-                
+                # Look for any clickable elements that might be body types.
+                # Parse the page once locally instead of one .text roundtrip per element.
+                soup = BeautifulSoup(self._get_page_source(), "lxml")
+                clickable_elements = soup.select('div[role="button"], button, div[tabindex]')
+                common_types = ['sedan', 'suv', 'coupe', 'hatchback',
+                                'convertible', 'wagon', 'truck', 'van']
+
                 for element in clickable_elements:
-                    try:
-                        # Check if element looks like a body type selector
-                        text = element.text.strip()
-                        if text and len(text) < 20:  # Body type names are usually short
-                            # Check if it's a common body type
-                            common_types = ['sedan', 'suv', 'coupe', 'hatchback', 
-                                          'convertible', 'wagon', 'truck', 'van']
-                            if any(body_type in text.lower() for body_type in common_types):
-                                if text not in body_types:
-                                    body_types.append(text)
-                    except Exception:
-                        continue
+                    # Check if element looks like a body type selector
+                    text = element.get_text(" ", strip=True)
+                    if text and len(text) < 20:  # Body type names are usually short
+                        # Check if it's a common body type
+                        if any(body_type in text.lower() for body_type in common_types):
+                            if text not in seen_body_types:
+                                seen_body_types.add(text)
+                                body_types.append(text)
 
         except TimeoutException:
             logger.warning("Body type container not found, might be single body type model")
@@ -187,23 +458,15 @@ class KBBResearchScraper:
         logger.info(f"Found {len(body_types)} body type(s): {body_types}")
         return body_types
     
-    def _extract_body_type_name(self, element) -> str:
-        """Extract body type name from element"""
+    def _extract_body_type_name(self, attributes: Dict[str, Optional[str]]) -> str:
+        """Extract body type name from an element's pre-fetched name attributes"""
         # Try different attributes in order of reliability
-        sources = [
-            ("aria-label", element.get_attribute("aria-label")),
-            ("text", element.text),
-            ("title", element.get_attribute("title")),
-            ("data-testid", element.get_attribute("data-testid")),
-            ("data-value", element.get_attribute("data-value")),
-            ("class", element.get_attribute("class"))
-        ]
-        
-        for source_name, value in sources:
+        for source_name in _BODY_TYPE_NAME_SOURCES:
+            value = attributes.get(source_name)
             if value:
                 cleaned = self._clean_body_type_name(value)
                 if cleaned:
-                    logger.debug(f"Got body type from {source_name}: {value} -> {cleaned}")
+                    logger.debug("Got body type from %s: %s -> %s", source_name, value, cleaned)
                     return cleaned
         
         return ""
@@ -213,47 +476,20 @@ class KBBResearchScraper:
         if not name:
             return ""
         
-        # Remove HTML entities and extra whitespace
-        name = re.sub(r'\s+', ' ', name).strip()
-        
+        # Remove HTML entities and extra whitespace. Lowercase once up front:
+        # the result is either a canonical mapping value or re-capitalized below,
+        # so the original casing is never needed.
+        name = _WS_RE.sub(' ', name).strip().lower()
+
         # Remove common indicators
-        remove_patterns = [
-            r'\(\d+\)',  # (2), (3) etc
-            r'\d+$',     # Trailing numbers
-            r'selected', 
-            r'unselected',
-            r'active',
-            r'inactive',
-            r'tab',
-            r'button',
-            r'^\d+\s*',  # Leading numbers
-        ]
-        
-        for pattern in remove_patterns:
-            name = re.sub(pattern, '', name, flags=re.IGNORECASE)
-        
+        for pattern in _BODY_TYPE_NOISE_PATTERNS:
+            name = pattern.sub('', name)
+
         # Standardize common names
-        name_lower = name.lower()
-        body_type_mapping = {
-            'sedan': 'Sedan',
-            'suv': 'SUV',
-            'coupe': 'Coupe',
-            'convertible': 'Convertible',
-            'hatchback': 'Hatchback',
-            'wagon': 'Wagon',
-            'truck': 'Truck',
-            'van': 'Van',
-            'minivan': 'Minivan',
-            'pickup': 'Pickup Truck',
-            'sport utility': 'SUV',
-            '4dr': '4-Door',
-            '2dr': '2-Door'
-        }
-        
-        for key, value in body_type_mapping.items():
-            if key in name_lower:
+        for key, value in _BODY_TYPE_NAMES:
+            if key in name:
                 return value
-        
+
         # Clean up and capitalize
         name = name.strip(' -:')
         if name:
@@ -265,90 +501,43 @@ class KBBResearchScraper:
     def _get_current_content_signature(self) -> str:
         """Get a signature of current page content to detect changes"""
         try:
-            # Get first trim name or first few cell values as signature
-            h3_elements = self.driver.find_elements(By.TAG_NAME, "h3")
-            for h3 in h3_elements[:5]:
-                text = h3.text.strip()
-                if text and len(text) > 5:
-                    return text
-            # Fallback: get first table cell content
-            cells = self.driver.find_elements(By.CSS_SELECTOR, "table td")
-            if cells:
-                return cells[0].text.strip()
+            # First meaningful trim name, else first table cell - in one roundtrip
+            return self.driver.execute_script(_CONTENT_SIGNATURE_JS) or ""
         except Exception:
-            pass
-        return ""
+            return ""
 
     def select_body_type(self, body_type_name: str) -> bool:
         """Click on a specific body type tab/button and wait for content to change"""
         try:
-            body_type_lower = body_type_name.lower()
-
             # Capture current content BEFORE clicking to detect change later
             old_signature = self._get_current_content_signature()
-            logger.debug(f"Content signature before click: {old_signature[:50] if old_signature else 'empty'}")
-
-            # Try different strategies to find and click the body type
-            selectors = [
-                f"//*[@role='tab' and contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{body_type_lower}')]",
-                f"//*[@role='tablist']//*[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{body_type_lower}')]",
-                f"//button[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{body_type_lower}')]",
-                f"//*[contains(@aria-label, '{body_type_name}') or contains(@aria-label, '{body_type_lower}')]",
-                f"//div[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{body_type_lower}')]",
-            ]
-
-            clicked = False
-            for selector in selectors:
-                if clicked:
-                    break
-                try:
-                    elements = self.driver.find_elements(By.XPATH, selector)
-                    for element in elements:
-                        try:
-                            # Check if already selected
-                            aria_selected = element.get_attribute("aria-selected")
-                            if aria_selected == "true":
-                                logger.debug(f"Body type '{body_type_name}' is already selected")
-                                return True
-
-                            # Check if clickable
-                            if element.is_displayed() and element.is_enabled():
-                                # Click the element
-                                self.driver.execute_script("arguments[0].click();", element)
-                                logger.info(f"Clicked on body type: {body_type_name}")
-                                clicked = True
-                                break
-                        except Exception as e:
-                            logger.debug(f"Could not click element: {e}")
-                            continue
+            logger.debug("Content signature before click: %.50s", old_signature or 'empty')
 
-                except (TimeoutException, NoSuchElementException):
-                    continue
+            # Find and click the body type in one browser pass (case-insensitive match)
+            self._page_cache.clear()
+            result = self.driver.execute_script(_CLICK_BODY_TYPE_JS, body_type_name)
+
+            if result == "selected":
+                logger.debug(f"Body type '{body_type_name}' is already selected")
+                return True
 
-            if not clicked:
+            if result != "clicked":
                 logger.warning(f"Could not find/click body type: {body_type_name}")
                 return False
 
+            logger.info(f"Clicked on body type: {body_type_name}")
+
             # CRITICAL: Wait for content to ACTUALLY CHANGE, not just exist
             max_wait = 10
-            wait_interval = 0.5
-            waited = 0
-
-            while waited < max_wait:
-                time.sleep(wait_interval)
-                waited += wait_interval
-
-                new_signature = self._get_current_content_signature()
-
-                # Check if content has changed
-                if new_signature and new_signature != old_signature:
-                    logger.info(f"Content changed after {waited}s - new signature: {new_signature[:50]}")
-                    # Give a bit more time for full render
-                    time.sleep(0.5)
-                    return True
+            try:
+                new_signature = WebDriverWait(self.driver, max_wait, poll_frequency=0.2).until(
+                    lambda d: (sig := self._get_current_content_signature()) and sig != old_signature and sig
+                )
+                logger.info("Content changed - new signature: %.50s", new_signature)
+            except TimeoutException:
+                logger.warning(f"Content did not change after clicking {body_type_name} (waited {max_wait}s)")
+                # Return True anyway - maybe content was already showing or detection failed
 
-            logger.warning(f"Content did not change after clicking {body_type_name} (waited {max_wait}s)")
-            # Return True anyway - maybe content was already showing or detection failed
             return True
 
         except Exception as e:
@@ -358,13 +547,16 @@ class KBBResearchScraper:
     def get_trim_names(self) -> List[str]:
         """Extract trim names from the page - universal approach"""
         trim_names = []
+        seen_trims = set()
 
         try:
-            # Debug: Log all h3 elements to understand page structure
-            all_h3 = self.driver.find_elements(By.TAG_NAME, "h3")
-            logger.debug(f"Found {len(all_h3)} h3 elements on page")
-            for i, h3 in enumerate(all_h3[:10]):
-                logger.debug(f"  h3[{i}]: {h3.text.strip()[:50]}")
+            # Debug: Log all h3 elements to understand page structure (each
+            # .text is a WebDriver round trip, so only when debug is on)
+            if logger.isEnabledFor(logging.DEBUG):
+                all_h3 = self.driver.find_elements(By.TAG_NAME, "h3")
+                logger.debug("Found %d h3 elements on page", len(all_h3))
+                for i, h3 in enumerate(all_h3[:10]):
+                    logger.debug("  h3[%d]: %.50s", i, h3.text.strip())
 
             # Strategy 1: Find trim cards by looking for parent containers with multiple children
             # Trim names are usually in repeating card structures
@@ -374,8 +566,9 @@ class KBBResearchScraper:
             )
             for elem in card_containers:
                 text = elem.text.strip()
-                if text and text not in trim_names and len(text) > 5:
-                    if text.lower() not in ['save', 'see pricing', 'compare', 'specifications']:
+                if text and text not in seen_trims and len(text) > 5:
+                    if text.lower() not in _TRIM_CARD_SKIP:
+                        seen_trims.add(text)
                         trim_names.append(text)
 
             # Strategy 2: Look for h3 elements that are siblings (same parent = card layout)
@@ -386,10 +579,10 @@ class KBBResearchScraper:
                     # Filter: trim names usually have make/model info or body style
                     if text and len(text) > 5 and len(text) < 60:
                         # Exclude common non-trim text
-                        excluded = ['save', 'pricing', 'compare', 'specification', 'feature',
-                                   'overview', 'review', 'research', 'price', 'msrp']
-                        if not any(ex in text.lower() for ex in excluded):
-                            if text not in trim_names:
+                        text_lower = text.lower()
+                        if not any(ex in text_lower for ex in _TRIM_HEADING_EXCLUDED):
+                            if text not in seen_trims:
+                                seen_trims.add(text)
                                 trim_names.append(text)
 
             # Strategy 3: Look in the comparison table header area
@@ -401,20 +594,21 @@ class KBBResearchScraper:
                     header_texts = table.find_elements(By.XPATH, ".//thead//*[string-length(text()) > 5]")
                     for elem in header_texts:
                         text = elem.text.strip()
-                        if text and text not in trim_names:
-                            if text.lower() not in ['save', 'see pricing', 'specifications']:
+                        if text and text not in seen_trims:
+                            if text.lower() not in _TRIM_HEADER_SKIP:
+                                seen_trims.add(text)
                                 trim_names.append(text)
                 except Exception:
                     pass
 
             if trim_names:
-                logger.info(f"Found {len(trim_names)} trim names: {trim_names}")
+                logger.info("Found %d trim names: %s", len(trim_names), trim_names)
             else:
                 logger.warning("No trim names found - check page structure")
 
         except Exception as e:
             logger.error(f"Error getting trim names: {e}")
-            logger.debug(traceback.format_exc())
+            logger.debug("Traceback:", exc_info=True)
 
         return trim_names
     
@@ -423,106 +617,83 @@ class KBBResearchScraper:
         specs = []
 
         try:
-            # Find the compare-trim-tables
-            spec_table = None
-            try:
-                spec_table = self.driver.find_element(By.ID, "compare-trim-tables")
+            # Find the compare-trim-tables, falling back to the largest table.
+            # Get table HTML in one call and parse locally (much faster than per-cell Selenium calls)
+            source, table_html = self._get_spec_table_html()
+            if source == "id":
                 logger.info("Found compare-trim-tables by ID")
-            except NoSuchElementException:
-                # Fallback: find largest table
-                tables = self.driver.find_elements(By.TAG_NAME, "table")
-                if tables:
-                    spec_table = max(tables, key=lambda t: len(t.find_elements(By.TAG_NAME, "tr")))
-                    logger.info("Using largest table as spec table")
+            elif source == "largest":
+                logger.info("Using largest table as spec table")
 
-            if not spec_table:
+            if table_html is None:
                 logger.error("No spec table found")
                 return specs
 
-            # Get table HTML in one call and parse locally (much faster than per-cell Selenium calls)
-            table_html = spec_table.get_attribute("innerHTML")
-            soup = BeautifulSoup(table_html, "html.parser")
-            rows = soup.find_all("tr")
-            logger.info(f"Table has {len(rows)} rows total")
-
-            # Debug first few rows
-            for i, row in enumerate(rows[:3]):
-                cells = row.find_all("td")
-                th_cells = row.find_all("th")
-                logger.debug(f"Row {i}: {len(th_cells)} th, {len(cells)} td")
-                if cells:
-                    logger.debug(f"  First cell text: '{cells[0].get_text(strip=True)[:30]}'")
-
-            # Extract specs from all rows
-            skip_labels = {'specifications', 'features', 'compare', 'save', 'see pricing', ''}
-            skip_prefixes = ('save ', 'see ')
-
-            for row in rows:
-                try:
-                    th_cells = row.find_all("th")
-                    cells = row.find_all("td")
-
-                    if th_cells and cells:
-                        all_cells = th_cells + cells
-                    elif cells:
-                        all_cells = cells
-                    elif th_cells:
-                        all_cells = th_cells
-                    else:
-                        all_cells = row.find_all("div", attrs={"role": "cell"})
-
-                    if not all_cells:
-                        continue
-
-                    cell_texts = [c.get_text(strip=True) for c in all_cells]
-
-                    if len(cell_texts) < 2:
-                        continue
-
-                    # First non-empty cell is the spec name
-                    spec_name = None
-                    value_start_idx = 0
+            specs = _parse_spec_rows(table_html)
 
-                    for idx, text in enumerate(cell_texts):
-                        if text and len(text) > 1:
-                            spec_name = text
-                            value_start_idx = idx + 1
-                            break
-
-                    if not spec_name:
-                        continue
-
-                    name_lower = spec_name.lower()
-                    if name_lower in skip_labels or name_lower.startswith(skip_prefixes):
-                        continue
-
-                    values = [text if text else "N/A" for text in cell_texts[value_start_idx:]]
-
-                    if values:
-                        specs.append({
-                            'label': spec_name,
-                            'values': values
-                        })
-
-                except Exception as e:
-                    logger.debug(f"Error parsing row: {e}")
-                    continue
-
-            logger.info(f"Extracted {len(specs)} specifications")
+            logger.info("Extracted %d specifications", len(specs))
 
             if specs:
-                logger.info(f"Sample specs: {[s['label'] for s in specs[:5]]}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Sample specs: %s", [s['label'] for s in specs[:5]])
             else:
                 logger.warning("No specs extracted - dumping table HTML structure")
-                for i, row in enumerate(rows[:3]):
-                    logger.warning(f"Row {i} HTML: {str(row)[:200]}")
+                logger.warning(f"Table HTML: {table_html[:600]}")
 
         except Exception as e:
             logger.error(f"Error getting specifications: {e}")
-            logger.debug(traceback.format_exc())
+            logger.debug("Traceback:", exc_info=True)
 
         return specs
     
+    def _get_spec_table_html(self) -> Tuple[Optional[str], Optional[str]]:
+        """Return (source, innerHTML) of the spec table, or (None, None) if there is none.
+
+        source is "id" for compare-trim-tables and "largest" for the
+        fallback table with the most rows. Runs in a single browser call
+        instead of find_element + get_attribute, or one roundtrip per table
+        and row for the fallback.
+        """
+        result = self.driver.execute_script(_SPEC_TABLE_JS)
+        if not result:
+            return None, None
+        return result[0], result[1]
+
+    def _get_page_source(self) -> str:
+        """Return the current page HTML, reusing the snapshot for this URL.
+
+        The snapshot cache is cleared on every navigation, body-type click
+        and content wait, so repeated reads of an unchanged page (block
+        check, style links, debug dumps) serialize the DOM only once.
+        """
+        url = self.driver.current_url
+        html = self._page_cache.get(url)
+        if html is not None:
+            self._page_cache.move_to_end(url)
+            return html
+
+        html = self._read_page_source()
+        self._page_cache[url] = html
+        if len(self._page_cache) > _PAGE_CACHE_MAX_ENTRIES:
+            self._page_cache.popitem(last=False)
+        return html
+
+    def _read_page_source(self) -> str:
+        """Read the current page HTML from the browser.
+
+        Uses the Chrome DevTools Protocol to read the serialized DOM, which is
+        cheaper than WebDriver's page_source for large pages. Falls back to
+        page_source on drivers without CDP support.
+        """
+        try:
+            result = self.driver.execute_cdp_cmd("Runtime.evaluate", {
+                "expression": "document.documentElement.outerHTML",
+                "returnByValue": True,
+            })
+            return result["result"]["value"]
+        except Exception:
+            return self.driver.page_source
+
     def _save_debug_html(self, filename: str):
         """Save current page HTML for debugging"""
         try:
@@ -530,7 +701,7 @@ class KBBResearchScraper:
             debug_dir.mkdir(parents=True, exist_ok=True)
             filepath = debug_dir / filename
             with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(self.driver.page_source)
+                f.write(self._get_page_source())
             logger.debug(f"Saved debug HTML to: {filepath}")
         except Exception as e:
             logger.debug(f"Could not save debug HTML: {e}")
@@ -539,8 +710,11 @@ class KBBResearchScraper:
         """Clean trim name by removing 'Save X of Y' prefix"""
         if not raw_name:
             return ""
-        # Remove "Save\nX of Y\n" pattern from start
-        cleaned = re.sub(r'^Save\s*\n?\d+\s+of\s+\d+\s*\n?', '', raw_name, flags=re.IGNORECASE)
+        # Remove "Save\nX of Y\n" pattern from start; most names have no such
+        # prefix, so skip the regex unless the name starts with "save"
+        if raw_name[:4].lower() != 'save':
+            return raw_name.strip()
+        cleaned = _SAVE_PREFIX_RE.sub('', raw_name)
         return cleaned.strip()
 
     def scrape_current_body_type_data(self) -> Dict[str, Any]:
@@ -551,9 +725,8 @@ class KBBResearchScraper:
         }
 
         try:
-            # Wait a moment for any dynamic content to load
-            time.sleep(1)
-
+            # Content readiness is already awaited by navigate_to_car_model /
+            # select_body_type, so no extra sleep is needed here.
             # Check if compare-trim-tables exists
             try:
                 table = self.driver.find_element(By.ID, "compare-trim-tables")
@@ -589,20 +762,20 @@ class KBBResearchScraper:
                 data['trim_names'] = trim_names
 
             # Drop the first element (trim names row); "See Pricing" is already
-            # filtered out by skip_labels in get_specifications().
+            # filtered out by _SKIP_LABELS in get_specifications().
             if len(all_specs) > 1:
                 data['specifications'] = all_specs[1:]
             else:
                 data['specifications'] = []
 
-            logger.info(f"Scraped {len(data['trim_names'])} trims, "
-                       f"{len(data['specifications'])} specs")
+            logger.info("Scraped %d trims, %d specs",
+                        len(data['trim_names']), len(data['specifications']))
 
             # Log sample data if available
             if data['trim_names']:
-                logger.info(f"Trim names: {data['trim_names']}")
-            if data['specifications']:
-                logger.info(f"Sample specs: {[s['label'] for s in data['specifications'][:5]]}")
+                logger.info("Trim names: %s", data['trim_names'])
+            if data['specifications'] and logger.isEnabledFor(logging.INFO):
+                logger.info("Sample specs: %s", [s['label'] for s in data['specifications'][:5]])
 
             # Save debug HTML only if no data found
             if not data['trim_names'] and not data['specifications']:
@@ -611,7 +784,7 @@ class KBBResearchScraper:
 
         except Exception as e:
             logger.error(f"Error scraping current body type data: {e}")
-            logger.debug(traceback.format_exc())
+            logger.debug("Traceback:", exc_info=True)
             # Save debug HTML on error
             self._save_debug_html(f"error_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html")
 
@@ -628,10 +801,10 @@ class KBBResearchScraper:
         """
         styles = []
         try:
-            soup = BeautifulSoup(self.driver.page_source, "html.parser")
+            soup = BeautifulSoup(self._get_page_source(), "lxml", parse_only=_A_HREF_STRAINER)
             seen_urls = set()
 
-            for a_tag in soup.find_all("a", href=True):
+            for a_tag in soup.find_all("a"):
                 href = a_tag["href"]
                 if "/styles/" not in href:
                     continue
@@ -654,108 +827,70 @@ class KBBResearchScraper:
 
             logger.info(f"Found {len(styles)} style links on overview page")
             for s in styles:
-                logger.debug(f"  Style: {s['name']} -> {s['url']}")
+                logger.debug("  Style: %s -> %s", s['name'], s['url'])
 
         except Exception as e:
             logger.error(f"Error extracting style links from overview: {e}")
 
         return styles
 
-    def _scrape_single_style_specs(self, style_url: str) -> List[Dict[str, Any]]:
+    def _scrape_single_style_specs(self, style_url: str) -> Tuple[List[str], List[str]]:
         """Navigate to a single style's page and scrape its specifications.
 
-        Returns list of dicts: [{'label': 'Horsepower', 'values': ['220']}, ...]
+        Returns parallel lists: (['Horsepower', ...], ['220', ...])
         Each spec has exactly one value since this is a single-style page.
+        Results are memoized per URL, so retries skip the page load.
         """
-        specs = []
+        cached = self._style_cache.get(style_url)
+        if cached is not None:
+            self._style_cache.move_to_end(style_url)
+            logger.info(f"Using cached specs for style page: {style_url}")
+            return cached
+
+        labels: List[str] = []
+        values: List[str] = []
         try:
             logger.info(f"Navigating to style page: {style_url}")
+            self._rate_limiter.acquire()
+            self._page_cache.clear()
             self.driver.get(style_url)
-            time.sleep(3)
 
-            # Wait for body
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
+            # Wait until a table is rendered rather than sleeping a fixed amount
+            try:
+                WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.TAG_NAME, "table"))
+                )
+            except TimeoutException:
+                logger.debug(f"No table appeared on style page: {style_url}")
 
             # Find a spec table — same approach as get_specifications()
-            spec_table = None
-            try:
-                spec_table = self.driver.find_element(By.ID, "compare-trim-tables")
+            source, table_html = self._get_spec_table_html()
+            if source == "id":
                 logger.info("Found compare-trim-tables on style page")
-            except NoSuchElementException:
-                tables = self.driver.find_elements(By.TAG_NAME, "table")
-                if tables:
-                    spec_table = max(tables, key=lambda t: len(t.find_elements(By.TAG_NAME, "tr")))
-                    logger.info("Using largest table on style page")
+            elif source == "largest":
+                logger.info("Using largest table on style page")
 
-            if not spec_table:
+            if table_html is None:
                 logger.warning(f"No spec table found on style page: {style_url}")
-                return specs
+                return labels, values
 
-            table_html = spec_table.get_attribute("innerHTML")
-            soup = BeautifulSoup(table_html, "html.parser")
-            rows = soup.find_all("tr")
+            # Single-style page: keep only the first non-empty value per spec
+            for spec in _parse_spec_rows(table_html, first_value_only=True):
+                labels.append(spec['label'])
+                values.append(spec['values'][0])
 
-            skip_labels = {'specifications', 'features', 'compare', 'save', 'see pricing', ''}
-            skip_prefixes = ('save ', 'see ')
+            logger.info("Extracted %d specs from style page", len(labels))
 
-            for row in rows:
-                try:
-                    th_cells = row.find_all("th")
-                    cells = row.find_all("td")
-
-                    if th_cells and cells:
-                        all_cells = th_cells + cells
-                    elif cells:
-                        all_cells = cells
-                    elif th_cells:
-                        all_cells = th_cells
-                    else:
-                        continue
-
-                    cell_texts = [c.get_text(strip=True) for c in all_cells]
-                    if len(cell_texts) < 2:
-                        continue
-
-                    spec_name = None
-                    value_start_idx = 0
-                    for idx, text in enumerate(cell_texts):
-                        if text and len(text) > 1:
-                            spec_name = text
-                            value_start_idx = idx + 1
-                            break
-
-                    if not spec_name:
-                        continue
-
-                    name_lower = spec_name.lower()
-                    if name_lower in skip_labels or name_lower.startswith(skip_prefixes):
-                        continue
-
-                    # Take only the first non-empty value
-                    value = "N/A"
-                    for text in cell_texts[value_start_idx:]:
-                        if text:
-                            value = text
-                            break
-
-                    specs.append({
-                        'label': spec_name,
-                        'values': [value]
-                    })
-
-                except Exception as e:
-                    logger.debug(f"Error parsing style spec row: {e}")
-                    continue
-
-            logger.info(f"Extracted {len(specs)} specs from style page")
+            if len(labels) >= _STYLE_CACHE_MIN_SPECS:
+                self._style_cache[style_url] = (labels, values)
+                if len(self._style_cache) > _STYLE_CACHE_MAX_ENTRIES:
+                    self._style_cache.popitem(last=False)
 
         except Exception as e:
             logger.error(f"Error scraping style page {style_url}: {e}")
-            logger.debug(traceback.format_exc())
+            logger.debug("Traceback:", exc_info=True)
 
-        return specs
+        return labels, values
 
     def _scrape_overview_styles(self, make: str, model: str, year: str) -> Dict[str, Any]:
         """Fallback: scrape specs from the overview page's Styles section.
@@ -774,30 +909,28 @@ class KBBResearchScraper:
 
         # Collect all style/trim names
         style_names = [s['name'] for s in style_links]
-        logger.info(f"Styles found: {style_names}")
+        logger.info("Styles found: %s", style_names)
 
         # Scrape specs from the first style page (used as mutual/shared data)
-        specs = []
+        labels: List[str] = []
+        values: List[str] = []
         for style in style_links:
-            time.sleep(settings.RESEARCH_CONFIG['delay_between_requests'])
-            specs = self._scrape_single_style_specs(style['url'])
-            if specs:
+            labels, values = self._scrape_single_style_specs(style['url'])
+            if labels:
                 logger.info(f"Got specs from style: {style['name']}")
                 break
             logger.warning(f"No specs from style: {style['name']}, trying next...")
 
-        if not specs:
+        if not labels:
             logger.warning(f"Could not get specs from any style for {year} {make} {model}")
             return {}
 
         # Replicate the single-style specs across all trims (mutual static data)
         num_trims = len(style_names)
-        expanded_specs = []
-        for spec in specs:
-            expanded_specs.append({
-                'label': spec['label'],
-                'values': spec['values'] * num_trims
-            })
+        expanded_specs = [
+            {'label': label, 'values': [value] * num_trims}
+            for label, value in zip(labels, values)
+        ]
 
         logger.info(f"Built fallback data: {num_trims} trims, {len(expanded_specs)} specs (mutual)")
 
@@ -808,8 +941,12 @@ class KBBResearchScraper:
             }
         }
 
-    def scrape_car_model(self, make: str, model: str, year: str) -> Dict[str, Any]:
-        """Main method to scrape all data for a car model with multiple body types"""
+    def scrape_car_model(self, make: str, model: str, year: str, save: bool = True) -> Dict[str, Any]:
+        """Main method to scrape all data for a car model with multiple body types.
+
+        With save=False the result is only returned, for callers that write
+        it themselves (e.g. the parent of a process pool).
+        """
         all_data = {
             'make': make,
             'model': model,
@@ -818,6 +955,9 @@ class KBBResearchScraper:
             'bodytypes': {}
         }
 
+        # Page snapshots never carry over between vehicles
+        self._page_cache.clear()
+
         # Navigate to the model page
         nav_result = self.navigate_to_car_model(make, model, year)
 
@@ -834,7 +974,8 @@ class KBBResearchScraper:
         if nav_result == "overview":
             logger.info(f"No specs comparison page -- using Styles fallback for {year} {make} {model}")
             all_data['bodytypes'] = self._scrape_overview_styles(make, model, year)
-            self.save_results(all_data, make, model, year)
+            if save:
+                self.save_results(all_data, make, model, year)
             return all_data
 
         # nav_result == "specs" -- normal path
@@ -880,18 +1021,23 @@ class KBBResearchScraper:
                     logger.warning(f"Could not select body type: {body_type}")
 
         # Save the data
-        self.save_results(all_data, make, model, year)
+        if save:
+            self.save_results(all_data, make, model, year)
 
         return all_data
     
     def save_results(self, data: Dict[str, Any], make: str, model: str, year: str):
+        """Queue scraped data for the background writer; see _write_results."""
+        self._writer.submit(self._write_results, data, make, model, year)
+
+    def _write_results(self, data: Dict[str, Any], make: str, model: str, year: str):
         """Save scraped data to CSV - appends to a single all_cars.csv file."""
         try:
-            from kbb_scraper.exporters.csv_exporter import CsvExporter
-
             csv_path = Path(settings.CSV_DATA_DIR) / "all_cars.csv"
-            exporter = CsvExporter(csv_path)
-            exporter.export(data)
+            if self._csv_exporter is None:
+                from kbb_scraper.exporters.csv_exporter import CsvExporter
+                self._csv_exporter = CsvExporter(csv_path)
+            self._csv_exporter.export(data)
 
             logger.info(f"Data saved to: {csv_path} ({make} {model} {year})")
 
@@ -899,7 +1045,11 @@ class KBBResearchScraper:
             logger.error(f"Error saving results: {e}")
     
     def close(self):
-        """Close the browser"""
+        """Flush saved results and close the browser"""
+        self._writer.close()
+        if self._csv_exporter is not None:
+            self._csv_exporter.close()
+            self._csv_exporter = None
         if self._driver_manager:
             self._driver_manager.close()
     
@@ -1,12 +1,15 @@
 """
 Scraper for KBB consumer reviews and expert review / recommendation data.
 
-Can operate standalone or reuse an existing Selenium WebDriver from the
-specifications scraper so that both datasets are collected in the same
-browser session.
-
-Usage (standalone):
-    scraper = KBBReviewsScraper(headless=True)
+Review pages are server-rendered, so by default they are fetched with a
+pooled HTTP session instead of a browser; a page whose HTML lacks the data
+the parser needs, or whose HTTP fetch fails for any reason other than a 404,
+is retried through Selenium (the driver is created lazily if none was given). Pass ``use_selenium=True`` to always load pages through
+Selenium, either standalone or reusing an existing WebDriver from the
+specifications scraper, or ``force_browser=True`` for a single call.
+
+Usage (standalone, HTTP):
+    scraper = KBBReviewsScraper()
     review_data = scraper.scrape_reviews("Toyota", "Camry", "2020")
     scraper.close()
 
@@ -14,73 +17,248 @@ Usage (sharing driver with specs scraper):
     specs_scraper = KBBResearchScraper(headless=True)
     specs = specs_scraper.scrape_car_model("Toyota", "Camry", "2020")
 
-    reviews_scraper = KBBReviewsScraper(driver=specs_scraper.driver)
+    reviews_scraper = KBBReviewsScraper(driver=specs_scraper.driver, use_selenium=True)
     review_data = reviews_scraper.scrape_reviews("Toyota", "Camry", "2020")
-    # Do NOT call reviews_scraper.close() — the specs scraper owns the driver.
+    # close() never quits a driver it did not create.
 """
-import csv
 import json
-import time
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional, Set, Tuple
 
+import requests
+from requests.adapters import HTTPAdapter
 from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
 from kbb_scraper.config import settings
 from kbb_scraper.drivers import DriverManager
+from kbb_scraper.exporters.csv_exporter import CsvRowSink
 from kbb_scraper.models.review_data import ConsumerReview, ExpertReview, ReviewData
 from kbb_scraper.parsers.review_parser import ReviewParser
+from kbb_scraper.utils.background_writer import BackgroundWriter
+from kbb_scraper.utils.rate_limiter import get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
+# Markers that must appear in the raw HTML for the parser to find any data;
+# without them the page needs a browser to render
+_CONSUMER_REVIEWS_ANCHOR = "aggregateRating"
+_EXPERT_REVIEW_ANCHOR = "application/ld+json"
+
+# Elements whose presence means a browser-loaded page has rendered its data
+_CONSUMER_REVIEWS_READY_SELECTOR = "script[type='application/ld+json']"
+_EXPERT_REVIEW_READY_SELECTOR = "script[type='application/ld+json']"
+
+# Polled through JS so the driver's implicit wait never applies
+_SELECTOR_PRESENT_JS = "return document.querySelector(arguments[0]) !== null;"
+
+
+class ReviewUrls(NamedTuple):
+    consumer_reviews: str
+    overview: str
+
+
+@lru_cache(maxsize=8192)
+def _review_urls(make: str, model: str, year: str) -> ReviewUrls:
+    """Build (once per vehicle) the KBB page URLs the review scrape loads."""
+    base = f"{settings.KBB_BASE_URL}/{make.lower()}/{model.lower()}/{year}/"
+    return ReviewUrls(consumer_reviews=f"{base}consumer-reviews/", overview=base)
+
+
+def compact_reviews_json(make: str, model: str,
+                         output_dir: Optional[Path] = None) -> Optional[Path]:
+    """
+    Fold ``{make}_{model}_reviews.ndjson`` into ``{make}_{model}_reviews.json``.
+
+    Both files live in *output_dir* (default ``settings.RAW_DATA_DIR``).
+    The last logged record per year wins.  The NDJSON log is removed once
+    the combined file has been written.  Returns the JSON path, or ``None``
+    if there was nothing to compact.
+    """
+    output_dir = Path(output_dir or settings.RAW_DATA_DIR)
+    log_path = output_dir / f"{make}_{model}_reviews.ndjson"
+    if not log_path.exists():
+        return None
+
+    records = []
+    # json.loads takes UTF-8 bytes directly, skipping the text-mode decode
+    with open(log_path, "rb") as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                # A torn final line from an interrupted run
+                logger.warning(f"Skipping malformed line in {log_path}")
+
+    filepath = output_dir / f"{make}_{model}_reviews.json"
+    if filepath.exists():
+        with open(filepath, "rb") as f:
+            combined = json.loads(f.read())
+    else:
+        combined = {
+            "make": make,
+            "model": model,
+            "years": {},
+        }
+
+    combined["years"].update({record["year"]: record["data"] for record in records})
+    combined["last_updated"] = records[-1]["ts"] if records else datetime.now().isoformat()
+
+    # No indent: only then does json use its C encoder
+    with open(filepath, "wb") as f:
+        f.write(json.dumps(combined, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+    log_path.unlink()
+
+    logger.info(f"Compacted {len(records)} review record(s) into: {filepath}")
+    return filepath
+
 
 class KBBReviewsScraper:
     """Scraper for KBB consumer reviews and expert review data."""
 
-    def __init__(self, driver: Optional[WebDriver] = None, headless: bool = True):
+    def __init__(self, driver: Optional[WebDriver] = None, headless: bool = True,
+                 use_selenium: bool = False):
         """
         Args:
             driver: An existing Selenium WebDriver to reuse.  When provided the
                     scraper will *not* close the driver on ``close()``.
-            headless: Only used when *driver* is ``None`` (creates its own).
+            headless: Only used when a driver has to be created.
+            use_selenium: Load pages through the WebDriver instead of plain
+                    HTTP.  Without it the WebDriver is only used as a
+                    fallback, and created on first use if *driver* is not
+                    given.
         """
-        if driver is not None:
-            self.driver = driver
-            self._owns_driver = False
-        else:
-            self._driver_manager = DriverManager(headless=headless)
-            self.driver = self._driver_manager.setup_driver()
-            self._owns_driver = True
-
+        self.use_selenium = use_selenium
+        self.driver = driver
+        self.headless = headless
+        self._owns_driver = False
+        # A WebDriver can only serve one thread at a time
+        self._browser_lock = threading.Lock()
+
+        if driver is None and use_selenium:
+            self._create_driver()
+
+        self._session = self._create_session()
+        self._rate_limiter = get_rate_limiter(settings.KBB_BASE_URL)
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="reviews")
         self._parser = ReviewParser()
+        # (make, model) pairs with an NDJSON log to compact on close()
+        self._pending_json: Set[Tuple[str, str]] = set()
+        # Buffered handle on all_reviews.csv, kept open until close()
+        self._csv_sink = CsvRowSink(Path(settings.CSV_DATA_DIR) / "all_reviews.csv",
+                                    self.REVIEW_CSV_COLUMNS)
+        self._writer = BackgroundWriter(name="reviews-writer")
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Create a pooled HTTP session with browser-like default headers."""
+        session = requests.Session()
+        session.headers.update(settings.HTTP_CONFIG["headers"])
+        adapter = HTTPAdapter(
+            pool_connections=settings.HTTP_CONFIG["pool_connections"],
+            pool_maxsize=settings.HTTP_CONFIG["pool_maxsize"],
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _create_driver(self):
+        """Start a WebDriver owned (and later closed) by this scraper."""
+        self._driver_manager = DriverManager(headless=self.headless)
+        self.driver = self._driver_manager.setup_driver()
+        self._owns_driver = True
 
     # ------------------------------------------------------------------ #
     #  Navigation helpers
     # ------------------------------------------------------------------ #
 
-    def _navigate(self, url: str) -> bool:
-        """Navigate to *url*, return ``True`` if the page loaded OK."""
+    def _fetch_html(self, url: str, anchor: str, ready_selector: str,
+                    force_browser: bool = False) -> Optional[str]:
+        """Return the HTML of *url*, or ``None`` if it could not be loaded.
+
+        Plain HTTP is tried first.  Only a real 404 / "Page Not Found" ends
+        there; any other failure (403/429 bot protection, other error
+        statuses, connection errors), or a response without *anchor*, is
+        retried through Selenium.
+        """
+        if self.use_selenium or force_browser:
+            return self._fetch_html_browser(url, ready_selector)
+
+        html, not_found = self._fetch_html_fast(url)
+        if not_found:
+            return None
+        if html is not None and anchor in html:
+            return html
+
+        if html is None:
+            logger.info(f"HTTP fetch failed, retrying in browser: {url}")
+        else:
+            logger.info(f"'{anchor}' missing from HTTP response, retrying in browser: {url}")
+        return self._fetch_html_browser(url, ready_selector)
+
+    def _fetch_html_browser(self, url: str, ready_selector: str) -> Optional[str]:
+        """Load *url* through the WebDriver and return its page source."""
+        with self._browser_lock:
+            if self.driver is None:
+                self._create_driver()
+            self._rate_limiter.acquire()
+            if not self._navigate(url, ready_selector):
+                return None
+            return self.driver.page_source
+
+    def _fetch_html_fast(self, url: str) -> Tuple[Optional[str], bool]:
+        """Fetch *url* over the pooled HTTP session.
+
+        Returns ``(html, not_found)``: *html* is ``None`` on any failure, and
+        *not_found* is ``True`` only for a 404 / "Page Not Found" page.
+        """
+        self._rate_limiter.acquire()
+        logger.info(f"Fetching: {url}")
+        try:
+            response = self._session.get(url, timeout=settings.HTTP_CONFIG["timeout"])
+        except requests.RequestException as e:
+            logger.warning(f"Error fetching {url}: {e}")
+            return None, False
+
+        if response.status_code == 404 or "Page Not Found" in response.text:
+            logger.warning(f"Page not found: {url}")
+            return None, True
+        if not response.ok:
+            logger.warning(f"HTTP {response.status_code} fetching: {url}")
+            return None, False
+
+        return response.text, False
+
+    def _navigate(self, url: str, ready_selector: Optional[str] = None) -> bool:
+        """Navigate to *url*, return ``True`` if the page loaded OK.
+
+        Waits for the document to finish loading, then briefly for
+        *ready_selector* in case the data is rendered by JS afterwards.
+        """
         logger.info(f"Navigating to: {url}")
         try:
             self.driver.get(url)
-            time.sleep(3)
-
-            WebDriverWait(self.driver, 15).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
+            WebDriverWait(self.driver, 15, poll_frequency=0.2).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
             )
 
             if "404" in self.driver.title or "Page Not Found" in self.driver.page_source:
                 logger.warning(f"Page not found: {url}")
                 return False
 
-            # Extra settle time for JS-rendered content
-            time.sleep(2)
+            if ready_selector:
+                try:
+                    WebDriverWait(self.driver, 5, poll_frequency=0.2).until(
+                        lambda d: d.execute_script(_SELECTOR_PRESENT_JS, ready_selector)
+                    )
+                except TimeoutException:
+                    logger.debug(f"'{ready_selector}' not rendered on: {url}")
             return True
 
         except TimeoutException:
@@ -94,14 +272,17 @@ class KBBReviewsScraper:
     #  Scrape consumer reviews
     # ------------------------------------------------------------------ #
 
-    def scrape_consumer_reviews(self, make: str, model: str, year: str) -> Optional[ConsumerReview]:
-        """Navigate to the consumer-reviews page and extract review data."""
-        url = f"{settings.KBB_BASE_URL}/{make.lower()}/{model.lower()}/{year}/consumer-reviews/"
+    def scrape_consumer_reviews(self, make: str, model: str, year: str,
+                                force_browser: bool = False) -> Optional[ConsumerReview]:
+        """Load the consumer-reviews page and extract review data."""
+        url = _review_urls(make, model, year).consumer_reviews
 
-        if not self._navigate(url):
+        html = self._fetch_html(url, _CONSUMER_REVIEWS_ANCHOR, _CONSUMER_REVIEWS_READY_SELECTOR,
+                                force_browser)
+        if html is None:
             return None
 
-        parsed = self._parser.parse_consumer_reviews_page(self.driver.page_source)
+        parsed = self._parser.parse_consumer_reviews_page(html)
 
         if not parsed.get("overall_rating"):
             logger.warning(f"No consumer review data found for {year} {make} {model}")
@@ -120,10 +301,11 @@ class KBBReviewsScraper:
             f"({review.review_count} reviews, "
             f"{review.recommend_percentage}% recommend)"
         )
-        if review.star_distribution:
-            logger.info(f"  Star distribution: {review.star_distribution}")
-        if review.category_ratings:
-            logger.info(f"  Category ratings: {review.category_ratings}")
+        if logger.isEnabledFor(logging.INFO):
+            if review.star_distribution:
+                logger.info("  Star distribution: %r", review.star_distribution)
+            if review.category_ratings:
+                logger.info("  Category ratings: %r", review.category_ratings)
 
         return review
 
@@ -131,14 +313,17 @@ class KBBReviewsScraper:
     #  Scrape expert review / recommendations
     # ------------------------------------------------------------------ #
 
-    def scrape_expert_review(self, make: str, model: str, year: str) -> Optional[ExpertReview]:
-        """Navigate to the model overview page and extract expert review data."""
-        url = f"{settings.KBB_BASE_URL}/{make.lower()}/{model.lower()}/{year}/"
+    def scrape_expert_review(self, make: str, model: str, year: str,
+                             force_browser: bool = False) -> Optional[ExpertReview]:
+        """Load the model overview page and extract expert review data."""
+        url = _review_urls(make, model, year).overview
 
-        if not self._navigate(url):
+        html = self._fetch_html(url, _EXPERT_REVIEW_ANCHOR, _EXPERT_REVIEW_READY_SELECTOR,
+                                force_browser)
+        if html is None:
             return None
 
-        parsed = self._parser.parse_expert_review_page(self.driver.page_source)
+        parsed = self._parser.parse_expert_review_page(html)
 
         review = ExpertReview(
             expert_rating=parsed.get("expert_rating"),
@@ -152,9 +337,9 @@ class KBBReviewsScraper:
         if review.ranking:
             logger.info(f"Ranking: {review.ranking}")
         if review.pros:
-            logger.info(f"Pros ({len(review.pros)}): {review.pros}")
+            logger.info("Pros (%d): %s", len(review.pros), review.pros)
         if review.cons:
-            logger.info(f"Cons ({len(review.cons)}): {review.cons}")
+            logger.info("Cons (%d): %s", len(review.cons), review.cons)
 
         # Return None only if we got absolutely nothing
         if not any([review.expert_rating, review.ranking, review.pros, review.cons]):
@@ -167,17 +352,27 @@ class KBBReviewsScraper:
     #  Combined scrape
     # ------------------------------------------------------------------ #
 
-    def scrape_reviews(self, make: str, model: str, year: str) -> ReviewData:
+    def scrape_reviews(self, make: str, model: str, year: str,
+                       force_browser: bool = False) -> ReviewData:
         """
         Scrape both consumer reviews and expert review for a vehicle.
 
         Always returns a ``ReviewData`` instance (individual fields may be
-        ``None`` if the corresponding page had no data).
+        ``None`` if the corresponding page had no data).  *force_browser*
+        skips the HTTP attempt and loads both pages through Selenium.
         """
         logger.info(f"=== Starting review scrape for {year} {make} {model} ===")
 
-        consumer_review = self.scrape_consumer_reviews(make, model, year)
-        expert_review = self.scrape_expert_review(make, model, year)
+        if self.use_selenium or force_browser:
+            # One browser can only load one page at a time
+            consumer_review = self.scrape_consumer_reviews(make, model, year, force_browser)
+            expert_review = self.scrape_expert_review(make, model, year, force_browser)
+        else:
+            # The two pages are independent; fetch them concurrently over HTTP
+            consumer_future = self._executor.submit(self.scrape_consumer_reviews, make, model, year)
+            expert_future = self._executor.submit(self.scrape_expert_review, make, model, year)
+            consumer_review = self._future_result(consumer_future, "consumer reviews")
+            expert_review = self._future_result(expert_future, "expert review")
 
         review_data = ReviewData(
             make=make,
@@ -190,6 +385,15 @@ class KBBReviewsScraper:
         self.save_results(review_data, make, model, year)
         return review_data
 
+    @staticmethod
+    def _future_result(future: Future, label: str):
+        """Return a concurrent page scrape's result, or ``None`` if it raised."""
+        try:
+            return future.result()
+        except Exception as e:
+            logger.error(f"Error scraping {label}: {e}")
+            return None
+
     # ------------------------------------------------------------------ #
     #  Persistence
     # ------------------------------------------------------------------ #
@@ -208,42 +412,45 @@ class KBBReviewsScraper:
         "pros", "cons",
     ]
 
+    # Flattened column names, built once instead of per row
+    _STAR_KEYS = tuple((f"star_{star}_pct", star) for star in range(5, 0, -1))
+    _CAT_KEYS = tuple((f"rating_{cat}", cat) for cat in
+                      ("value", "performance", "quality", "comfort", "reliability", "styling"))
+
     # ------------------------------------------------------------------ #
     #  Persistence
     # ------------------------------------------------------------------ #
 
     def save_results(self, review_data: ReviewData, make: str, model: str, year: str):
-        """Save review data to both JSON and CSV."""
-        self._save_json(review_data, make, model, year)
-        self._save_csv(review_data, make, model, year)
+        """Queue review data to be saved to both JSON and CSV on the writer thread."""
+        self._writer.submit(self._save_json, review_data, make, model, year)
+        self._writer.submit(self._save_csv, review_data, make, model, year)
 
     def _save_json(self, review_data: ReviewData, make: str, model: str, year: str):
-        """Save review data to ``data/raw/{make}_{model}_reviews.json``."""
+        """
+        Append review data to ``data/raw/{make}_{model}_reviews.ndjson``.
+
+        The log is folded into ``{make}_{model}_reviews.json`` by
+        ``compact_reviews_json`` when the scraper is closed, unless
+        ``settings.COMPACT_REVIEWS_ON_CLOSE`` is off (parallel workers).
+        """
         try:
             output_dir = Path(settings.RAW_DATA_DIR)
             output_dir.mkdir(parents=True, exist_ok=True)
 
-            filename = f"{make}_{model}_reviews.json"
-            filepath = output_dir / filename
+            filepath = output_dir / f"{make}_{model}_reviews.ndjson"
+            record = {
+                "year": year,
+                "data": review_data.to_dict(),
+                "ts": datetime.now().isoformat(),
+            }
 
-            # Load existing data
-            if filepath.exists():
-                with open(filepath, "r", encoding="utf-8") as f:
-                    combined = json.load(f)
-            else:
-                combined = {
-                    "make": make,
-                    "model": model,
-                    "years": {},
-                }
+            line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+            with open(filepath, "ab", buffering=1 << 16) as f:
+                f.write(line.encode("utf-8"))
+            self._pending_json.add((make, model))
 
-            combined["years"][year] = review_data.to_dict()
-            combined["last_updated"] = datetime.now().isoformat()
-
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(combined, f, indent=2, ensure_ascii=False)
-
-            logger.info(f"Review JSON saved to: {filepath}")
+            logger.info(f"Review JSON appended to: {filepath}")
 
         except Exception as e:
             logger.error(f"Error saving review JSON: {e}")
@@ -251,27 +458,14 @@ class KBBReviewsScraper:
     def _save_csv(self, review_data: ReviewData, make: str, model: str, year: str):
         """Append one row to ``data/csv/all_reviews.csv``."""
         try:
-            csv_path = Path(settings.CSV_DATA_DIR) / "all_reviews.csv"
-            csv_path.parent.mkdir(parents=True, exist_ok=True)
-
-            row = self._flatten_review(review_data)
-            file_exists = csv_path.exists()
-
-            with open(csv_path, "a", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(
-                    f, fieldnames=self.REVIEW_CSV_COLUMNS, extrasaction="ignore"
-                )
-                if not file_exists:
-                    writer.writeheader()
-                writer.writerow(row)
-
-            logger.info(f"Review CSV appended to: {csv_path}")
+            self._csv_sink.write(self._flatten_review(review_data))
+            logger.info(f"Review CSV appended to: {self._csv_sink.csv_path}")
 
         except Exception as e:
             logger.error(f"Error saving review CSV: {e}")
 
-    @staticmethod
-    def _flatten_review(review_data: ReviewData) -> dict:
+    @classmethod
+    def _flatten_review(cls, review_data: ReviewData) -> dict:
         """Flatten a ReviewData instance into a single CSV row dict."""
         row: dict = {
             "make": review_data.make,
@@ -284,11 +478,12 @@ class KBBReviewsScraper:
             row["consumer_overall_rating"] = cr.overall_rating
             row["consumer_review_count"] = cr.review_count
             row["consumer_recommend_pct"] = cr.recommend_percentage
-            for star in range(5, 0, -1):
-                row[f"star_{star}_pct"] = cr.star_distribution.get(star)
-            for cat in ("value", "performance", "quality", "comfort",
-                        "reliability", "styling"):
-                row[f"rating_{cat}"] = cr.category_ratings.get(cat)
+            stars = cr.star_distribution
+            for key, star in cls._STAR_KEYS:
+                row[key] = stars.get(star)
+            categories = cr.category_ratings
+            for key, cat in cls._CAT_KEYS:
+                row[key] = categories.get(cat)
 
         er = review_data.expert_review
         if er:
@@ -304,8 +499,22 @@ class KBBReviewsScraper:
     # ------------------------------------------------------------------ #
 
     def close(self):
-        """Close the browser — only when this instance created its own driver."""
-        if self._owns_driver and hasattr(self, "_driver_manager"):
+        """
+        Compact the review JSON logs written by this instance, then close the
+        HTTP session, and the browser only when this instance created it.
+        """
+        self._executor.shutdown(wait=True)
+        self._writer.close()
+        if settings.COMPACT_REVIEWS_ON_CLOSE:
+            for make, model in sorted(self._pending_json):
+                try:
+                    compact_reviews_json(make, model)
+                except Exception as e:
+                    logger.error(f"Error compacting review JSON for {make} {model}: {e}")
+        self._pending_json.clear()
+        self._csv_sink.close()
+        self._session.close()
+        if self._owns_driver:
             self._driver_manager.close()
 
     def __enter__(self):
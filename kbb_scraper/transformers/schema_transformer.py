@@ -2,7 +2,7 @@
 Schema transformer for converting raw KBB data to 4-table database schema.
 """
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 from ..models.db_schema import (
     Vehicle, VehicleSpecs, VehicleFeatures, VehicleScores, FourTableDataset
@@ -15,6 +15,10 @@ from ..parsers.value_parser import (
 
 logger = logging.getLogger(__name__)
 
+# Alias groups, already lowercased to match the spec lookup keys
+_ZTS_KEYS = ("0 - 60", "0 to 60", "0-60")
+_WB_KEYS = ("wheel base", "wheelbase")
+
 
 class SchemaTransformer:
     """
@@ -90,6 +94,8 @@ class SchemaTransformer:
         "premium sound": "premium_audio",
         "premium sound system": "premium_audio",
     }
+    # vehicle_features fields in declaration order
+    _FEATURE_FIELDS = tuple(dict.fromkeys(FEATURES_MAP.values()))
 
     def __init__(self):
         self.processed_specs = set()
@@ -158,7 +164,9 @@ class SchemaTransformer:
             return
 
         # Build lookup: spec_name -> {trim_index: value}
-        spec_lookup = self._build_spec_lookup(specifications, len(trim_names))
+        spec_lookup = self._build_spec_lookup(specifications)
+        year_int = int(year)
+        vehicles, specs_rows, features_rows, scores_rows = [], [], [], []
 
         # Process each trim
         for trim_idx, raw_trim_name in enumerate(trim_names):
@@ -166,12 +174,12 @@ class SchemaTransformer:
 
             # Generate vehicle ID
             vehicle_id = generate_vehicle_id(
-                make, model, int(year), trim_name, tab_name
+                make, model, year_int, trim_name, tab_name
             )
 
             # Create vehicle record
             vehicle = self._create_vehicle(
-                vehicle_id, make, model, int(year), trim_name,
+                vehicle_id, make, model, year_int, trim_name,
                 tab_name, spec_lookup, trim_idx
             )
 
@@ -184,46 +192,55 @@ class SchemaTransformer:
             # Create scores record (empty - not scraped)
             scores = VehicleScores(vehicle_id=vehicle_id)
 
-            dataset.add_vehicle(vehicle, specs, features, scores)
+            vehicles.append(vehicle)
+            specs_rows.append(specs)
+            features_rows.append(features)
+            scores_rows.append(scores)
+
+        dataset.add_vehicles(vehicles, specs_rows, features_rows, scores_rows)
 
-    def _build_spec_lookup(self, specifications: List[Dict[str, Any]],
-                           num_trims: int) -> Dict[str, List[str]]:
+    def _build_spec_lookup(self, specifications: List[Dict[str, Any]]) -> Dict[str, List[str]]:
         """
         Build a lookup dictionary from spec name to list of values by trim index.
 
-        Uses first occurrence for duplicate spec names.
+        Uses first occurrence for duplicate spec names. Value lists are stored
+        as-is; the getters bounds-check, so short lists read as missing.
         """
         lookup = {}
-        seen_specs = set()
 
         for spec in specifications:
             spec_name = spec.get('label', spec.get('spec_name', '')).strip().lower()
-            values = spec.get('values', [])
 
             # Skip if already seen (use first occurrence)
-            if spec_name in seen_specs:
+            if spec_name in lookup:
                 continue
-            seen_specs.add(spec_name)
-
-            # Pad or truncate values to match number of trims
-            if len(values) < num_trims:
-                values = values + [''] * (num_trims - len(values))
-            elif len(values) > num_trims:
-                values = values[:num_trims]
 
-            lookup[spec_name] = values
+            lookup[spec_name] = spec.get('values', [])
 
         return lookup
 
     def _get_spec_value(self, spec_lookup: Dict[str, List[str]],
                         spec_name: str, trim_idx: int) -> Optional[str]:
-        """Get a spec value for a given trim, returning None if not found."""
-        values = spec_lookup.get(spec_name.lower())
+        """Get a spec value for a given trim, returning None if not found.
+
+        *spec_name* must already be lowercase, like the lookup keys.
+        """
+        values = spec_lookup.get(spec_name)
         if values and trim_idx < len(values):
             val = values[trim_idx]
             return val if val else None
         return None
 
+    @staticmethod
+    def _first_spec_value(spec_lookup: Dict[str, List[str]],
+                          names: Tuple[str, ...], trim_idx: int) -> Optional[str]:
+        """Value of the first alias in *names* that is set for this trim."""
+        for name in names:
+            values = spec_lookup.get(name)
+            if values and trim_idx < len(values) and values[trim_idx]:
+                return values[trim_idx]
+        return None
+
     def _create_vehicle(self, vehicle_id: int, make: str, model: str, year: int,
                         trim: str, body_type: str, spec_lookup: Dict[str, List[str]],
                         trim_idx: int) -> Vehicle:
@@ -264,12 +281,8 @@ class SchemaTransformer:
         torque = parse_torque(torque_str) if torque_str else None
 
         # Parse 0-60 (try multiple variations)
-        zero_to_sixty = None
-        for spec_name in ["0 - 60", "0 to 60", "0-60"]:
-            zts_str = self._get_spec_value(spec_lookup, spec_name, trim_idx)
-            if zts_str:
-                zero_to_sixty = parse_zero_to_sixty(zts_str)
-                break
+        zts_str = self._first_spec_value(spec_lookup, _ZTS_KEYS, trim_idx)
+        zero_to_sixty = parse_zero_to_sixty(zts_str) if zts_str else None
 
         # Parse top speed
         ts_str = self._get_spec_value(spec_lookup, "top speed", trim_idx)
@@ -284,11 +297,7 @@ class SchemaTransformer:
         curb_weight = parse_weight(cw_str) if cw_str else None
 
         # Parse wheelbase
-        wb_str = None
-        for spec_name in ["wheel base", "wheelbase"]:
-            wb_str = self._get_spec_value(spec_lookup, spec_name, trim_idx)
-            if wb_str:
-                break
+        wb_str = self._first_spec_value(spec_lookup, _WB_KEYS, trim_idx)
         wheelbase = parse_dimension(wb_str) if wb_str else None
 
         # Parse cargo space
@@ -317,30 +326,16 @@ class SchemaTransformer:
     def _create_features(self, vehicle_id: int, spec_lookup: Dict[str, List[str]],
                          trim_idx: int) -> VehicleFeatures:
         """Create a VehicleFeatures record."""
-        # Helper to check multiple possible spec names
-        def get_feature(possible_names: List[str]) -> Optional[bool]:
-            for name in possible_names:
-                val = self._get_spec_value(spec_lookup, name, trim_idx)
-                if val:
-                    return feature_to_bool(val)
-            return None
-
-        return VehicleFeatures(
-            vehicle_id=vehicle_id,
-            leather_seats=get_feature(["leather seats", "literseather seats"]),
-            heated_seats=get_feature(["heated seats", "heated front seats"]),
-            heated_rear_seats=get_feature(["heated rear seats"]),
-            ambient_lighting=get_feature(["ambient lighting", "interior ambient lighting"]),
-            adaptive_headlights=get_feature(["adaptive headlights", "adaptive front headlights"]),
-            panorama_roof=get_feature([
-                "panorama moon roof", "panoramic moon roof", "panorama roof",
-                "panoramic roof", "moonroof", "moon roof", "sunroof"
-            ]),
-            navigation=get_feature(["navigation system", "navigation", "gps navigation"]),
-            parking_assist=get_feature([
-                "parking assist", "park assist", "parking sensors", "rear parking sensors"
-            ]),
-            premium_audio=get_feature([
-                "premium radio", "premium audio", "premium sound", "premium sound system"
-            ])
-        )
+        # One pass over FEATURES_MAP; the first alias set for this trim
+        # decides each field, even when it maps to None
+        features = dict.fromkeys(self._FEATURE_FIELDS)
+        resolved = set()
+        for spec_name, field in self.FEATURES_MAP.items():
+            if field in resolved:
+                continue
+            values = spec_lookup.get(spec_name)
+            if values and trim_idx < len(values) and values[trim_idx]:
+                features[field] = feature_to_bool(values[trim_idx])
+                resolved.add(field)
+
+        return VehicleFeatures(vehicle_id=vehicle_id, **features)
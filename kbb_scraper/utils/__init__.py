@@ -3,5 +3,8 @@ Utility functions for KBB scraper.
 """
 from .file_handler import DataSaver
 from .helpers import setup_logging, extract_car_info_from_url
+from .rate_limiter import RateLimiter, get_rate_limiter, set_rate_share
+from .background_writer import BackgroundWriter
 
-__all__ = ["DataSaver", "setup_logging", "extract_car_info_from_url"]
+__all__ = ["DataSaver", "setup_logging", "extract_car_info_from_url",
+           "RateLimiter", "get_rate_limiter", "set_rate_share", "BackgroundWriter"]
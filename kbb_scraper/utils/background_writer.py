@@ -0,0 +1,53 @@
+"""
+Background thread that runs disk writes in submission order, off the scrape loop.
+"""
+import logging
+import queue
+import threading
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class BackgroundWriter(threading.Thread):
+    """Single consumer thread for save callables.
+
+    ``submit`` returns immediately; ``close`` waits for every queued write to
+    finish.  Writes run one at a time, so the callables need no locking of
+    their own against each other.
+    """
+
+    def __init__(self, name: str = "writer"):
+        super().__init__(name=name, daemon=True)
+        self.queue: "queue.Queue" = queue.Queue()
+        self._closed = False
+        self.start()
+
+    def submit(self, func: Callable[..., Any], *args, **kwargs):
+        """Queue ``func(*args, **kwargs)`` to run on the writer thread."""
+        if self._closed:
+            raise RuntimeError("BackgroundWriter is closed")
+        self.queue.put_nowait((func, args, kwargs))
+
+    def run(self):
+        while True:
+            item = self.queue.get()
+            try:
+                if item is _STOP:
+                    return
+                func, args, kwargs = item
+                func(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"Background write failed: {e}", exc_info=True)
+            finally:
+                self.queue.task_done()
+
+    def close(self):
+        """Drain the queue and stop the thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self.queue.put_nowait(_STOP)
+        self.join()
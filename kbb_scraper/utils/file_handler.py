@@ -8,12 +8,52 @@ import logging
 import traceback
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 
 from ..config.settings import RAW_DATA_DIR, PROCESSED_DATA_DIR, RESEARCH_CONFIG
 
 logger = logging.getLogger(__name__)
 
+# Columns of a parsed-spec frame, one row per spec x trim
+_SPEC_COLUMNS = ('spec_name', 'spec_category', 'unit', 'trim_name', 'value', 'is_numeric')
+# Metadata columns leading each row of the combined file
+_COMBINED_META_COLUMNS = ('scrape_date', 'make', 'model', 'year', 'tab_name', 'body_type')
+# Low-cardinality columns repeated on every row of a parsed-spec frame
+_CATEGORICAL_SPEC_COLUMNS = ('spec_name', 'spec_category', 'unit', 'trim_name')
+_CATEGORICAL_FORMATS = frozenset({'csv', 'parquet'})
+
+
+# Write buffer for CSV output; to_csv emits many small chunks
+_CSV_WRITE_BUFFER = 1 << 20
+
+
+def _write_csv(df: pd.DataFrame, filepath: Path):
+    with open(filepath, 'w', encoding='utf-8', newline='', buffering=_CSV_WRITE_BUFFER) as f:
+        df.to_csv(f, index=False)
+
+
+def _write_json(df: pd.DataFrame, filepath: Path):
+    df.to_json(filepath, orient='records')
+
+
+def _write_parquet(df: pd.DataFrame, filepath: Path):
+    df.to_parquet(filepath, index=False, compression='zstd')
+
+
+@lru_cache(maxsize=256)
+def _ensure_dir(path: Path):
+    """Create *path* once per process; later calls skip the mkdir syscall"""
+    path.mkdir(parents=True, exist_ok=True)
+
+
+# data_format -> (writer, file suffix)
+_WRITERS = {
+    'csv': (_write_csv, '.csv'),
+    'json': (_write_json, '.json'),
+    'parquet': (_write_parquet, '.parquet'),
+}
+
 class DataSaver:
     """Handles saving scraped data - FIXED save methods"""
 
@@ -22,11 +62,17 @@ class DataSaver:
         self.processed_data_dir = PROCESSED_DATA_DIR
         self.data_format = RESEARCH_CONFIG['data_format']
         self.include_timestamp = RESEARCH_CONFIG['include_timestamp']
+        self.save_raw_json = RESEARCH_CONFIG.get('save_raw_json', True)
+        # Repeated string columns are stored as categoricals for the tabular formats
+        self.use_categories = self.data_format in _CATEGORICAL_FORMATS
+        self._write_df, self._ext = _WRITERS.get(self.data_format, (None, None))
 
     def save_bodytype_data(self, bodytype_data: Dict[str, Any],
                           filename: str, body_type: str,
                           make: str, model: str, year: str):
         """Save data for a specific body type - FIXED parameter handling"""
+        # One clock read shared by the filename timestamp and scrape_date
+        now = datetime.now()
         try:
             # Check if bodytype_data is valid
             if not bodytype_data or not isinstance(bodytype_data, dict):
@@ -39,12 +85,12 @@ class DataSaver:
 
             # Create filename with timestamp if configured
             if self.include_timestamp:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = now.strftime("%Y%m%d_%H%M%S")
                 filename = f"{timestamp}_{filename}"
 
             # Create body type directory
             bodytype_dir = self.raw_data_dir / body_type
-            bodytype_dir.mkdir(parents=True, exist_ok=True)
+            _ensure_dir(bodytype_dir)
             filepath = bodytype_dir / filename
 
             # Convert to DataFrame
@@ -55,31 +101,28 @@ class DataSaver:
 
             if df is not None and not df.empty:
                 # Add metadata columns
-                df.insert(0, 'body_type', body_type)
-                df.insert(0, 'tab_name', bodytype_data.get('tab_name', ''))
-                df.insert(0, 'year', year)
-                df.insert(0, 'model', model)
-                df.insert(0, 'make', make)
-                df.insert(0, 'scrape_date', datetime.now().strftime("%Y-%m-%d"))
+                df = self._prepend_columns(df, {
+                    'scrape_date': now.strftime("%Y-%m-%d"),
+                    'make': make,
+                    'model': model,
+                    'year': year,
+                    'tab_name': bodytype_data.get('tab_name', ''),
+                    'body_type': body_type,
+                })
 
                 # Save based on format
-                if self.data_format == 'csv':
-                    filepath = filepath.with_suffix('.csv')
-                    df.to_csv(filepath, index=False, encoding='utf-8')
-                elif self.data_format == 'json':
-                    filepath = filepath.with_suffix('.json')
-                    df.to_json(filepath, orient='records', indent=2)
-                elif self.data_format == 'parquet':
-                    filepath = filepath.with_suffix('.parquet')
-                    df.to_parquet(filepath, index=False)
+                filepath = self._write_frame(df, filepath)
 
                 logger.info(f"💾 Saved {body_type} data to {filepath}")
                 logger.info(f"   📊 {len(df)} rows, {len(bodytype_data['trim_names'])} trims")
 
-                # Also save raw JSON for reference
-                raw_json_path = filepath.with_suffix('.raw.json')
-                with open(raw_json_path, 'w', encoding='utf-8') as f:
-                    json.dump(bodytype_data, f, indent=2, ensure_ascii=False)
+                # Also save raw JSON for reference (compact; indent forces the
+                # pure-Python encoder)
+                if self.save_raw_json:
+                    raw_json_path = filepath.with_suffix('.raw.json')
+                    raw_json_path.write_bytes(json.dumps(
+                        bodytype_data, ensure_ascii=False, separators=(',', ':')
+                    ).encode('utf-8'))
             else:
                 logger.warning(f"⚠️  No data to save for {body_type}")
 
@@ -93,100 +136,125 @@ class DataSaver:
         if not specifications or not trim_names:
             return pd.DataFrame()
 
-        rows = []
+        columns = {col: [] for col in _SPEC_COLUMNS}
+        self._append_columns(columns, specifications, trim_names)
+
+        df = pd.DataFrame(columns)
+        if self.use_categories:
+            df = df.astype({col: 'category' for col in _CATEGORICAL_SPEC_COLUMNS})
+
+        return df
+
+    @staticmethod
+    def _append_columns(columns: Dict[str, List[Any]], specifications: List[Dict[str, Any]],
+                        trim_names: List[str], extra_meta: Optional[Dict[str, Any]] = None) -> int:
+        """Extend the column lists in *columns* with one row per spec x trim.
+
+        *extra_meta* values are repeated on every appended row. Returns the
+        number of rows added.
+        """
+        n_trims = len(trim_names)
+        # Empty strings become NA at construction instead of a full-frame replace()
+        trim_col = [t if t != '' else pd.NA for t in trim_names]
+
+        spec_names, spec_categories, units = (
+            columns['spec_name'], columns['spec_category'], columns['unit']
+        )
+        trim_names_col, values_col, is_numeric_col = (
+            columns['trim_name'], columns['value'], columns['is_numeric']
+        )
+        n_rows = 0
         for spec in specifications:
             spec_name = spec.get('spec_name', '')
             spec_category = spec.get('spec_category', '')
             unit = spec.get('unit', '')
             values = spec.get('values', [])
-            is_numeric = spec.get('is_numeric', False)
-
-            # Ensure values list matches trim_names length
-            if len(values) != len(trim_names):
-                # Pad or truncate values to match trim_names
-                if len(values) < len(trim_names):
-                    values = values + [''] * (len(trim_names) - len(values))
-                else:
-                    values = values[:len(trim_names)]
 
-            # Create one row per trim
-            for trim_name, value in zip(trim_names, values):
-                row = {
-                    'spec_name': spec_name,
-                    'spec_category': spec_category,
-                    'unit': unit,
-                    'trim_name': trim_name,
-                    'value': value,
-                    'is_numeric': is_numeric
-                }
-                rows.append(row)
-
-        df = pd.DataFrame(rows)
-
-        # Clean up empty values
-        df = df.replace('', pd.NA)
-
-        return df
+            # Pad or truncate values to match trim_names
+            values = [v if v != '' else pd.NA for v in values[:n_trims]]
+            if len(values) < n_trims:
+                values.extend([pd.NA] * (n_trims - len(values)))
+
+            spec_names.extend([spec_name if spec_name != '' else pd.NA] * n_trims)
+            spec_categories.extend([spec_category if spec_category != '' else pd.NA] * n_trims)
+            units.extend([unit if unit != '' else pd.NA] * n_trims)
+            trim_names_col.extend(trim_col)
+            values_col.extend(values)
+            is_numeric_col.extend([spec.get('is_numeric', False)] * n_trims)
+            n_rows += n_trims
+
+        if extra_meta and n_rows:
+            for col, value in extra_meta.items():
+                columns[col].extend([value] * n_rows)
+
+        return n_rows
+
+    def _write_frame(self, df: pd.DataFrame, filepath: Path) -> Path:
+        """Write *df* in the configured format; returns the path written"""
+        if self._write_df is None:
+            logger.warning(f"⚠️  Unsupported data format: {self.data_format}")
+            return filepath
+        filepath = filepath.with_suffix(self._ext)
+        self._write_df(df, filepath)
+        return filepath
+
+    def _prepend_columns(self, df: pd.DataFrame, columns: Dict[str, Any]) -> pd.DataFrame:
+        """Prepend constant-valued columns in one concat instead of repeated inserts"""
+        meta = pd.DataFrame(columns, index=df.index)
+        if self.use_categories:
+            meta = meta.astype('category')
+        return pd.concat([meta, df], axis=1)
 
     def save_combined_data(self, results: Dict[str, Any],
                           make: str, model: str, year: str):
         """Save all data combined in one file - FIXED"""
+        # One clock read shared by the filename timestamp and scrape_date
+        now = datetime.now()
         try:
             # Check if results has bodytypes
             if 'bodytypes' not in results or not results['bodytypes']:
                 logger.warning(f"⚠️  No bodytypes data to combine for {make} {model} {year}")
                 return
 
-            # Create combined DataFrame
-            all_dfs = []
+            # Accumulate every body type into one set of column lists, then
+            # build a single DataFrame (no per-body-type frames or concat)
+            columns = {col: [] for col in (*_COMBINED_META_COLUMNS, *_SPEC_COLUMNS)}
+            scrape_date = now.strftime("%Y-%m-%d")
 
             for body_type, data in results['bodytypes'].items():
                 if isinstance(data, dict) and 'specifications' in data and 'trim_names' in data:
-                    df = self._create_dataframe_from_parsed_data(
-                        data['specifications'],
-                        data['trim_names']
-                    )
-
-                    if df is not None and not df.empty:
-                        # Add identifying columns
-                        df.insert(0, 'body_type', body_type)
-                        df.insert(0, 'tab_name', data.get('tab_name', ''))
-                        all_dfs.append(df)
+                    self._append_columns(columns, data['specifications'], data['trim_names'], {
+                        'scrape_date': scrape_date,
+                        'make': make,
+                        'model': model,
+                        'year': year,
+                        'tab_name': data.get('tab_name', ''),
+                        'body_type': body_type,
+                    })
                 else:
                     logger.warning(f"⚠️  Invalid data structure for {body_type}: {type(data)}")
 
-            if not all_dfs:
+            if not columns['spec_name']:
                 logger.warning(f"⚠️  No valid data to combine for {make} {model} {year}")
                 return
 
-            combined_df = pd.concat(all_dfs, ignore_index=True)
-
-            # Add common metadata
-            combined_df.insert(0, 'year', year)
-            combined_df.insert(0, 'model', model)
-            combined_df.insert(0, 'make', make)
-            combined_df.insert(0, 'scrape_date', datetime.now().strftime("%Y-%m-%d"))
-
-            # Remove any completely empty rows
-            combined_df = combined_df.dropna(how='all')
+            combined_df = pd.DataFrame(columns)
+            if self.use_categories:
+                combined_df = combined_df.astype({
+                    col: 'category'
+                    for col in (*_COMBINED_META_COLUMNS, *_CATEGORICAL_SPEC_COLUMNS)
+                })
 
             # Save to processed directory
             filename = f"{make.lower()}_{model.lower()}_{year}_combined.{self.data_format}"
             if self.include_timestamp:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = now.strftime("%Y%m%d_%H%M%S")
                 filename = f"{timestamp}_{filename}"
 
+            _ensure_dir(self.processed_data_dir)
             filepath = self.processed_data_dir / filename
 
-            if self.data_format == 'csv':
-                filepath = filepath.with_suffix('.csv')
-                combined_df.to_csv(filepath, index=False, encoding='utf-8')
-            elif self.data_format == 'json':
-                filepath = filepath.with_suffix('.json')
-                combined_df.to_json(filepath, orient='records', indent=2)
-            elif self.data_format == 'parquet':
-                filepath = filepath.with_suffix('.parquet')
-                combined_df.to_parquet(filepath, index=False)
+            filepath = self._write_frame(combined_df, filepath)
 
             logger.info(f"💾 Saved combined data to {filepath}")
             logger.info(f"   📊 Total rows: {len(combined_df)}")
@@ -197,9 +265,11 @@ class DataSaver:
 
     def save_single_dataset(self, results: Dict[str, Any], filename: str):
         """Save single dataset (no body type separation) - FIXED"""
+        # One clock read shared by the filename timestamp and scrape_date
+        now = datetime.now()
         try:
             if self.include_timestamp:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = now.strftime("%Y%m%d_%H%M%S")
                 filename = f"{timestamp}_{filename}"
 
             filepath = self.raw_data_dir / filename
@@ -216,25 +286,22 @@ class DataSaver:
 
                         if df is not None and not df.empty:
                             if 'tab_name' in data:
-                                df.insert(0, 'tab_name', data['tab_name'])
+                                df = self._prepend_columns(df, {'tab_name': data['tab_name']})
                             all_dfs.append(df)
 
                 if all_dfs:
                     combined_df = pd.concat(all_dfs, ignore_index=True)
 
                     # Add metadata
-                    combined_df.insert(0, 'year', results['year'])
-                    combined_df.insert(0, 'model', results['model'])
-                    combined_df.insert(0, 'make', results['make'])
-                    combined_df.insert(0, 'scrape_date', datetime.now().strftime("%Y-%m-%d"))
+                    combined_df = self._prepend_columns(combined_df, {
+                        'scrape_date': now.strftime("%Y-%m-%d"),
+                        'make': results['make'],
+                        'model': results['model'],
+                        'year': results['year'],
+                    })
 
                     # Save
-                    if self.data_format == 'csv':
-                        filepath = filepath.with_suffix('.csv')
-                        combined_df.to_csv(filepath, index=False, encoding='utf-8')
-                    elif self.data_format == 'json':
-                        filepath = filepath.with_suffix('.json')
-                        combined_df.to_json(filepath, orient='records', indent=2)
+                    filepath = self._write_frame(combined_df, filepath)
 
                     logger.info(f"💾 Saved single dataset to {filepath}")
 
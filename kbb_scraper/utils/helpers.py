@@ -2,11 +2,20 @@
 Helper functions for the scraper
 """
 import logging
+import re
 import time
 import random
 from typing import List, Dict, Any
 from pathlib import Path
 
+# Characters not allowed in filenames, mapped to '_' in one str.translate pass
+_FN_TRANSLATE = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+_MULTI_UNDERSCORE = re.compile(r'_+')
+# /make/model/year followed by /specs/ or the end of the URL
+_URL_PATTERN = re.compile(r'/([^/]+)/([^/]+)/(\d{4})(?:/specs/?|/?$)')
+# Elements whose strings BeautifulSoup's get_text() leaves out
+_NON_TEXT_TAGS = frozenset({'script', 'style', 'template'})
+
 def setup_logging():
     """Setup logging configuration"""
     import logging.config
@@ -22,13 +31,11 @@ def delay_random(min_seconds: float = 1, max_seconds: float = 3):
 
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename for safe saving"""
-    import re
-
     # Remove invalid characters
-    filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
+    filename = filename.translate(_FN_TRANSLATE)
 
     # Remove multiple underscores
-    filename = re.sub(r'_+', '_', filename)
+    filename = _MULTI_UNDERSCORE.sub('_', filename)
 
     # Limit length
     if len(filename) > 200:
@@ -42,10 +49,7 @@ def extract_car_info_from_url(url: str) -> Dict[str, str]:
     Preserves hyphens in model names (e.g. CR-V stays CR-V, not Cr V).
     Capitalises each hyphen-separated segment independently.
     """
-    import re
-
-    pattern = r'/([^/]+)/([^/]+)/(\d{4})(?:/specs/?|/?$)'
-    match = re.search(pattern, url)
+    match = _URL_PATTERN.search(url)
 
     if match:
         def _title_keep_hyphens(slug: str) -> str:
@@ -67,20 +71,21 @@ def validate_data(data: Dict[str, Any]) -> bool:
     """Validate scraped data has minimum required fields"""
     required = ['make', 'model', 'year']
 
-    for field in required:
-        if field not in data or not data[field]:
-            return False
+    if not all(data.get(field) for field in required):
+        return False
 
     # Check if we have any actual data
     if 'bodytypes' in data:
-        if not data['bodytypes']:
-            return False
-        for bodytype_data in data['bodytypes'].values():
-            if 'specifications' not in bodytype_data or not bodytype_data['specifications']:
-                return False
+        bodytypes = data['bodytypes']
+        # Every body type needs specifications
+        return bool(bodytypes) and all(
+            isinstance(bt, dict) and bt.get('specifications') for bt in bodytypes.values()
+        )
     elif 'data' in data:
-        if not data['data']:
-            return False
+        # At least one entry needs specifications
+        return any(
+            isinstance(d, dict) and d.get('specifications') for d in data['data'] or ()
+        )
 
     return True
 
@@ -93,4 +98,27 @@ def get_file_size(filepath: Path) -> str:
             return f"{size:.2f} {unit}"
         size /= 1024.0
 
-    return f"{size:.2f} TB"
\ No newline at end of file
+    return f"{size:.2f} TB"
+
+def element_text(element, separator: str = "") -> str:
+    """lxml equivalent of BeautifulSoup's get_text(separator, strip=True)
+
+    Each text fragment is stripped and empty ones are dropped; text inside
+    script, style and template elements (and comments) is skipped.
+    """
+    return separator.join(_text_fragments(element))
+
+def _text_fragments(element):
+    """Stripped, non-empty text fragments of *element* in document order"""
+    if element.text:
+        text = element.text.strip()
+        if text:
+            yield text
+    for child in element:
+        # Comments and processing instructions have a non-str tag
+        if isinstance(child.tag, str) and child.tag not in _NON_TEXT_TAGS:
+            yield from _text_fragments(child)
+        if child.tail:
+            tail = child.tail.strip()
+            if tail:
+                yield tail
@@ -0,0 +1,67 @@
+"""
+Thread-safe token-bucket rate limiting, shared per host across scrapers.
+"""
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlsplit
+
+from kbb_scraper.config import settings
+
+
+class RateLimiter:
+    """Token bucket allowing *burst* requests at once, refilled one per *min_interval* seconds."""
+
+    def __init__(self, min_interval: float, burst: int = 1):
+        self.min_interval = min_interval
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        if self.min_interval <= 0:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            # Tokens go negative while callers are queued, so later callers wait longer
+            tokens = min(self.burst, self._tokens + (now - self._updated) / self.min_interval)
+            self._tokens = tokens - 1
+            self._updated = now
+            wait = 0.0 if tokens >= 1 else (1 - tokens) * self.min_interval
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+# Number of processes splitting the configured per-host rate (see set_rate_share)
+_rate_share = 1
+
+
+def get_rate_limiter(url: str) -> RateLimiter:
+    """Return the process-wide limiter for the host of *url* (or a bare hostname)."""
+    host = urlsplit(url).netloc or url
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = RateLimiter(settings.RATE_LIMIT_DELAY * _rate_share,
+                                  settings.RATE_LIMIT_BURST)
+            _limiters[host] = limiter
+        return limiter
+
+
+def set_rate_share(shares: int):
+    """Give this process 1/*shares* of the configured per-host request rate.
+
+    Used when *shares* processes scrape the same host at once (``--workers``),
+    so together they stay within ``settings.RATE_LIMIT_DELAY``.
+    """
+    global _rate_share
+    with _limiters_lock:
+        _rate_share = max(1, shares)
+        for limiter in _limiters.values():
+            limiter.min_interval = settings.RATE_LIMIT_DELAY * _rate_share
@@ -16,9 +16,14 @@ Usage:
 
     # With reviews and db export:
     uv run python run_parallel.py --test --workers 4 --run --with-reviews --export-db
+
+    # One scraper process driving 4 browser processes; results are written
+    # straight to data/ by that single process, so there is nothing to merge:
+    uv run python run_parallel.py --test --workers 4 --run --single-writer
 """
 import argparse
 import csv
+import io
 import json
 import os
 import signal
@@ -26,10 +31,12 @@ import shutil
 import subprocess
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from math import ceil
 from pathlib import Path
 
 from kbb_scraper.config import get_scrape_combinations, get_stats
+from kbb_scraper.scrapers.reviews_scraper import compact_reviews_json
 
 # Global list so the signal handler can access running worker processes
 _active_procs: list = []
@@ -41,6 +48,14 @@ FINAL_CSV = Path("data/csv/all_cars.csv")
 FINAL_REVIEWS_CSV = Path("data/csv/all_reviews.csv")
 FINAL_RAW = Path("data/raw")
 FINAL_4TABLE = Path("data/processed/4table")
+# Seconds between checks for finished worker processes
+WORKER_POLL_SECONDS = 1.0
+# Threads for the many small, syscall-bound file copies in the merge phase
+COPY_THREADS = 8
+# Chunk size when concatenating NDJSON review logs
+REVIEW_COPY_BUFFER = 1 << 20
+# Per-worker review log written by KBBReviewsScraper: {make}_{model}_reviews.ndjson
+REVIEW_LOG_SUFFIX = "_reviews.ndjson"
 
 
 # ------------------------------------------------------------------ #
@@ -105,16 +120,60 @@ def _shutdown_handler(signum, frame):
     sys.exit(1)
 
 
+def _start_worker(i: int, total: int, path: Path, extra_flags: list[str]):
+    """Start the scraper on one batch file; returns (proc, log handle)."""
+    worker_dir = WORKERS_DIR / f"worker_{i}"
+    worker_dir.mkdir(parents=True, exist_ok=True)
+
+    cmd = [
+        "uv", "run", "python", "-m", "kbb_scraper",
+        "--batch-file", str(path),
+        "--output-dir", str(worker_dir),
+    ] + extra_flags
+
+    log_file = BATCH_DIR / f"worker_{i}.log"
+    fh = open(log_file, "w")
+    print(f"  Worker {i}/{total}: {path.name}")
+    print(f"    output -> {worker_dir}")
+    print(f"    log    -> {log_file}")
+    # Leave review logs as NDJSON; merge_raw_json_files concatenates them
+    env = {**os.environ, "SCRAPER_COMPACT_REVIEWS": "0"}
+    return subprocess.Popen(cmd, stdout=fh, stderr=subprocess.STDOUT, env=env), fh
+
+
+def _prewarm_chromedriver() -> bool:
+    """Install ChromeDriver into the shared ~/.wdm/ cache once, up front.
+
+    Workers then find the driver cached instead of racing to download it.
+    Returns False if the install failed (workers fall back to the stagger).
+    """
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        path = ChromeDriverManager().install()
+    except Exception as e:
+        print(f"  ChromeDriver pre-install failed ({e}); staggering worker start instead")
+        return False
+    print(f"  ChromeDriver cached: {path}")
+    return True
+
+
 def launch_workers(batch_paths: list[Path], extra_flags: list[str],
-                    stagger_seconds: int = 5) -> int:
-    """Launch one scraper process per batch file and wait for all to finish.
+                    stagger_seconds: int = 5, max_concurrent: int | None = None) -> int:
+    """Run one scraper process per batch file and wait for all to finish.
 
     Each worker writes to its own isolated directory under data/workers/
     to prevent any file-level conflicts.
 
-    Workers are started with a stagger delay so the first worker caches the
-    ChromeDriver binary before subsequent workers attempt to use it
-    (avoids webdriver-manager race conditions on the shared ~/.wdm/ cache).
+    At most *max_concurrent* workers (default: one per CPU) run at a time;
+    queued batches start as running workers exit, so a large --workers value
+    does not oversubscribe the machine.
+
+    ChromeDriver is installed once before any worker starts, so workers
+    launch back to back. If that fails, the first worker is given a head
+    start so it caches the ChromeDriver binary before the others attempt to
+    use it (avoids webdriver-manager race conditions on the shared ~/.wdm/
+    cache).
     """
     global _active_procs
 
@@ -127,100 +186,273 @@ def launch_workers(batch_paths: list[Path], extra_flags: list[str],
         shutil.rmtree(WORKERS_DIR)
     WORKERS_DIR.mkdir(parents=True, exist_ok=True)
 
-    procs = []
-
-    for i, path in enumerate(batch_paths, 1):
-        worker_dir = WORKERS_DIR / f"worker_{i}"
-        worker_dir.mkdir(parents=True, exist_ok=True)
-
-        cmd = [
-            "uv", "run", "python", "-m", "kbb_scraper",
-            "--batch-file", str(path),
-            "--output-dir", str(worker_dir),
-        ] + extra_flags
-
-        log_file = BATCH_DIR / f"worker_{i}.log"
-        fh = open(log_file, "w")
-        print(f"  Worker {i}/{len(batch_paths)}: {path.name}")
-        print(f"    output -> {worker_dir}")
-        print(f"    log    -> {log_file}")
-        proc = subprocess.Popen(cmd, stdout=fh, stderr=subprocess.STDOUT)
-        procs.append((i, proc, fh))
-
-        # Stagger: let the first worker cache ChromeDriver before others start
-        if i < len(batch_paths):
-            print(f"    (waiting {stagger_seconds}s before next worker...)")
-            time.sleep(stagger_seconds)
-
-    # Track globally so signal handler can clean up
-    _active_procs = procs
-
-    print(f"\n{len(procs)} workers running. Waiting for all to finish...\n")
-
-    failed = 0
-    for i, proc, fh in procs:
-        proc.wait()
-        fh.close()
-        status = "OK" if proc.returncode == 0 else f"FAILED (exit {proc.returncode})"
-        print(f"  Worker {i} finished: {status}")
-        if proc.returncode != 0:
-            failed += 1
+    if _prewarm_chromedriver():
+        stagger_seconds = 0
+
+    total = len(batch_paths)
+    if max_concurrent is None:
+        max_concurrent = os.cpu_count() or 1
+    max_concurrent = max(1, min(max_concurrent, total))
+    if max_concurrent < total:
+        print(f"  (running at most {max_concurrent} workers at a time)")
 
+    pending = list(enumerate(batch_paths, 1))
+    # Running (i, proc, fh) entries; shared with the signal handler
     _active_procs = []
+    started_at: dict[int, float] = {}
+    done = failed = 0
+    announced = False
+
+    while pending or _active_procs:
+        # Fill free slots
+        while pending and len(_active_procs) < max_concurrent:
+            i, path = pending.pop(0)
+            proc, fh = _start_worker(i, total, path, extra_flags)
+            _active_procs.append((i, proc, fh))
+            started_at[i] = time.monotonic()
+
+            # Head start: let the first worker cache ChromeDriver before others start
+            if i == 1 and pending and stagger_seconds:
+                print(f"    (waiting {stagger_seconds}s before next worker...)")
+                time.sleep(stagger_seconds)
+
+            if not announced and (len(_active_procs) == max_concurrent or not pending):
+                announced = True
+                print(f"\n{len(_active_procs)} workers running, {len(pending)} queued. "
+                      f"Waiting for workers to finish...\n")
+
+        # Reap finished workers
+        time.sleep(WORKER_POLL_SECONDS)
+        still_running = []
+        for i, proc, fh in _active_procs:
+            if proc.poll() is None:
+                still_running.append((i, proc, fh))
+                continue
+            fh.close()
+            done += 1
+            elapsed = time.monotonic() - started_at[i]
+            status = "OK" if proc.returncode == 0 else f"FAILED (exit {proc.returncode})"
+            print(f"  Worker {i} finished after {elapsed:.0f}s: {status} ({done}/{total} done)")
+            if proc.returncode != 0:
+                failed += 1
+        _active_procs = still_running
+
     return failed
 
 
+def single_writer_command(batch_path: Path, workers: int, extra_flags: list[str]) -> list[str]:
+    """Command for one scraper process that runs *workers* browser processes.
+
+    The scraper's own --workers pool scrapes in child processes but does all
+    CSV / JSON writes in the parent, so it can write the shared data/
+    directory directly and no merge phase is needed.
+    """
+    return [
+        "uv", "run", "python", "-m", "kbb_scraper",
+        "--batch-file", str(batch_path),
+        "--workers", str(workers),
+    ] + extra_flags
+
+
 # ------------------------------------------------------------------ #
 #  Merge worker outputs into final data/ directory
 # ------------------------------------------------------------------ #
 
-def _merge_one_csv(pattern: str, dest: Path, label: str):
-    """Merge per-worker CSV files matching *pattern* into *dest*."""
+def _merge_one_csv(pattern: str, dest: Path, label: str) -> str | None:
+    """Merge per-worker CSV files matching *pattern* into *dest*.
+
+    When every worker file has the same header line (the usual case, as they
+    all come from the same exporter) the files are byte-appended. Otherwise
+    the output schema is the union of the worker headers in first-seen order,
+    and each worker file is streamed into it with csv.reader/csv.writer, so
+    memory stays flat however many rows the workers wrote.
+
+    Returns a one-line summary, or None when no worker produced the file.
+    """
     worker_csvs = sorted(WORKERS_DIR.glob(pattern))
     if not worker_csvs:
-        return
+        return None
 
     dest.parent.mkdir(parents=True, exist_ok=True)
 
+    # Fast path: identical headers -> copy the bytes, skipping repeated headers
+    headers = {}
+    for csv_path in worker_csvs:
+        with open(csv_path, "rb") as f:
+            header_line = f.readline()
+        if header_line.strip():
+            headers[csv_path] = header_line
+    if len(set(headers.values())) == 1:
+        _append_csv_bytes(list(headers), dest)
+        return f"  {label}: {len(headers)} files appended -> {dest}"
+
+    # Pass 1: headers only, to build the column union
     all_headers: list[str] = []
     header_set: set[str] = set()
-    all_rows: list[dict] = []
+    file_headers: dict[Path, list[str]] = {}
 
     for csv_path in worker_csvs:
         with open(csv_path, "r", newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            if reader.fieldnames:
-                for col in reader.fieldnames:
-                    if col not in header_set:
-                        all_headers.append(col)
-                        header_set.add(col)
-            for row in reader:
-                all_rows.append(row)
+            header = next(csv.reader(f), None)
+        if not header:
+            continue
+        file_headers[csv_path] = header
+        for col in header:
+            if col not in header_set:
+                all_headers.append(col)
+                header_set.add(col)
+
+    # Pass 2: stream each file into dest. A file already in the union's column
+    # order is byte-copied; the rest are reindexed row by row (missing
+    # columns -> ""). Either way no file is held in memory.
+    with io.TextIOWrapper(open(dest, "wb"), encoding="utf-8", newline="",
+                          write_through=True) as text:
+        writer = csv.writer(text)
+        writer.writerow(all_headers)
+        for csv_path, header in file_headers.items():
+            if header == all_headers:
+                _copy_csv_body(csv_path, text.buffer)
+            else:
+                writer.writerows(_reindexed_rows(csv_path, all_headers))
+
+    return f"  {label}: {len(file_headers)} files merged -> {dest}"
 
-    with open(dest, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=all_headers, extrasaction="ignore")
-        writer.writeheader()
-        writer.writerows(all_rows)
 
-    print(f"  {label}: {len(all_rows)} rows -> {dest}")
+def _reindexed_rows(csv_path: Path, all_headers: list[str]):
+    """Yield the data rows of *csv_path* in *all_headers* order ("" if missing)."""
+    with open(csv_path, "r", newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        positions: dict[str, int] = {}
+        for i, col in enumerate(next(reader)):
+            positions.setdefault(col, i)
+        index = [positions.get(col) for col in all_headers]
+        for row in reader:
+            if not row:
+                continue  # blank line
+            n = len(row)
+            yield [row[i] if i is not None and i < n else "" for i in index]
+
+
+def _copy_csv_body(csv_path: Path, out, with_header: bool = False):
+    """Copy *csv_path* to binary *out*, skipping its header line unless asked.
+
+    A missing final line break is added so the next file starts on its own line.
+    """
+    with open(csv_path, "rb") as src:
+        header_line = src.readline()
+        if with_header:
+            out.write(header_line)
+        shutil.copyfileobj(src, out, 1 << 20)
+        size = src.tell()
+        if size > len(header_line):
+            src.seek(size - 1)
+            if src.read(1) != b"\n":
+                out.write(b"\r\n")
+
+
+def _append_csv_bytes(csv_paths: list[Path], dest: Path):
+    """Concatenate CSV files sharing one header line into *dest*, header once."""
+    with open(dest, "wb") as out:
+        for i, csv_path in enumerate(csv_paths):
+            _copy_csv_body(csv_path, out, with_header=(i == 0))
 
 
 def merge_csv_files():
     """Merge per-worker CSV files into final data/csv/ directory."""
-    _merge_one_csv("worker_*/csv/all_cars.csv", FINAL_CSV, "Specs CSV")
-    _merge_one_csv("worker_*/csv/all_reviews.csv", FINAL_REVIEWS_CSV, "Reviews CSV")
+    # The two merges touch disjoint files, so they run side by side
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [
+            pool.submit(_merge_one_csv, "worker_*/csv/all_cars.csv", FINAL_CSV, "Specs CSV"),
+            pool.submit(_merge_one_csv, "worker_*/csv/all_reviews.csv",
+                        FINAL_REVIEWS_CSV, "Reviews CSV"),
+        ]
+        # Print in a fixed order once both are done (concurrent prints interleave)
+        for future in futures:
+            summary = future.result()
+            if summary:
+                print(summary)
+
+
+def _deep_merge_review(filename: str, paths: list[Path], dest_dir: Path):
+    """Deep-merge one review JSON file by year key (runs in a pool process)."""
+    combined = {}
+    for p in paths:
+        data = json.loads(p.read_bytes())
+        if not combined:
+            combined = data
+        else:
+            # Merge years dict
+            combined.setdefault("years", {}).update(data.get("years", {}))
+    # Compact, like the scraper's own compaction (indent forces the pure-Python encoder)
+    dest = dest_dir / filename
+    dest.write_bytes(
+        json.dumps(combined, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    )
+
+
+def _merge_review_logs(filename: str, paths: list[Path], dest_dir: Path):
+    """Concatenate the workers' NDJSON review logs, then compact the result.
+
+    The logs are byte-concatenated into a fresh dest_dir/filename (never
+    appended to, so a re-run of the merge does not duplicate records), and
+    compact_reviews_json folds it into {make}_{model}_reviews.json, where
+    the last record per year wins.
+    """
+    log_path = dest_dir / filename
+    with open(log_path, "wb") as fdst:
+        for p in paths:
+            with open(p, "rb") as fsrc:
+                shutil.copyfileobj(fsrc, fdst, REVIEW_COPY_BUFFER)
+                if fsrc.tell() == 0:
+                    continue
+                # Terminate a torn final line so it cannot swallow the next record
+                fsrc.seek(-1, os.SEEK_END)
+                if fsrc.read(1) != b"\n":
+                    fdst.write(b"\n")
+
+    # KBB makes are hyphenated ("Land-Rover"), so the first "_" ends the make
+    make, model = filename[:-len(REVIEW_LOG_SUFFIX)].split("_", 1)
+    compact_reviews_json(make, model, output_dir=dest_dir)
+
+
+def _fast_copy(src: Path, dest: Path):
+    """Like shutil.copy2, but lets the kernel copy (or reflink) the data.
+
+    Uses os.copy_file_range where available and falls back to shutil.copy2
+    (which itself uses sendfile on Linux) if the call is unsupported.
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is not None:
+        try:
+            with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                shutil.copystat(src, dest)
+                return
+        except OSError:
+            pass
+    shutil.copy2(src, dest)
 
 
 def merge_raw_json_files():
     """Merge per-worker raw JSON files into data/raw/.
 
-    Reviews JSON files use a {make}_{model}_reviews.json format with a
-    nested "years" dict, so we deep-merge by year key.
+    Workers leave reviews as {make}_{model}_reviews.ndjson logs, which are
+    concatenated per filename without parsing and then compacted into
+    {make}_{model}_reviews.json.  Already-compacted worker
+    {make}_{model}_reviews.json files (nested "years" dict) are deep-merged
+    by year key first.
     """
     FINAL_RAW.mkdir(parents=True, exist_ok=True)
     worker_raw_dirs = sorted(WORKERS_DIR.glob("worker_*/raw"))
 
     review_files: dict[str, list[Path]] = {}  # filename -> [paths]
+    review_logs: dict[str, list[Path]] = {}  # filename -> [paths], NDJSON
     other_files: list[Path] = []
 
     for raw_dir in worker_raw_dirs:
@@ -230,34 +462,36 @@ def merge_raw_json_files():
                 dest = FINAL_RAW / f.name
                 if not dest.exists():
                     shutil.copytree(f, dest)
+            elif f.name.endswith(REVIEW_LOG_SUFFIX):
+                review_logs.setdefault(f.name, []).append(f)
             elif f.name.endswith("_reviews.json"):
                 review_files.setdefault(f.name, []).append(f)
             else:
                 other_files.append(f)
 
-    # Deep-merge review JSON files
-    merged_reviews = 0
-    for filename, paths in review_files.items():
-        combined = {}
-        for p in paths:
-            with open(p, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            if not combined:
-                combined = data
-            else:
-                # Merge years dict
-                combined.setdefault("years", {}).update(data.get("years", {}))
-        dest = FINAL_RAW / filename
-        with open(dest, "w", encoding="utf-8") as f:
-            json.dump(combined, f, indent=2, ensure_ascii=False)
-        merged_reviews += 1
+    # Deep-merge review JSON files, one file per pool task (JSON parsing is CPU-bound)
+    merged_reviews = len(review_files)
+    if review_files:
+        max_workers = min(merged_reviews, os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            list(pool.map(_deep_merge_review, review_files.keys(), review_files.values(),
+                          [FINAL_RAW] * merged_reviews))
+
+    # Concatenate and compact NDJSON review logs, after the deep-merge so the
+    # logged records are folded into any merged _reviews.json
+    with ThreadPoolExecutor(max_workers=COPY_THREADS) as pool:
+        list(pool.map(_merge_review_logs, review_logs.keys(), review_logs.values(),
+                      [FINAL_RAW] * len(review_logs)))
 
     # Copy non-review files (no conflict — unique per make+model+year)
-    for src in other_files:
-        dest = FINAL_RAW / src.name
-        shutil.copy2(src, dest)
+    # If two workers wrote the same name, the later worker wins (as with serial
+    # copies), and no two threads ever write one destination
+    latest = {src.name: src for src in other_files}
+    with ThreadPoolExecutor(max_workers=COPY_THREADS) as pool:
+        list(pool.map(lambda src: _fast_copy(src, FINAL_RAW / src.name), latest.values()))
 
     print(f"  Raw:     {merged_reviews} review files merged, "
+          f"{len(review_logs)} review logs compacted, "
           f"{len(other_files)} other files copied -> {FINAL_RAW}")
 
 
@@ -268,9 +502,10 @@ def merge_4table_files():
         return
 
     FINAL_4TABLE.mkdir(parents=True, exist_ok=True)
-    for src in worker_4tables:
-        dest = FINAL_4TABLE / src.name
-        shutil.copy2(src, dest)
+    # Copies are I/O-bound, so threads are enough
+    latest = {src.name: src for src in worker_4tables}  # later worker wins
+    with ThreadPoolExecutor(max_workers=COPY_THREADS) as pool:
+        list(pool.map(lambda src: _fast_copy(src, FINAL_4TABLE / src.name), latest.values()))
 
     print(f"  4-table: {len(worker_4tables)} files -> {FINAL_4TABLE}")
 
@@ -324,6 +559,9 @@ def main():
                         help="Pass --export-db to each worker")
     parser.add_argument("--no-headless", action="store_true",
                         help="Pass --no-headless to each worker")
+    parser.add_argument("--single-writer", action="store_true",
+                        help="Run one scraper process with --workers browser processes "
+                             "that writes straight to data/ (no worker dirs, no merge)")
 
     args = parser.parse_args()
 
@@ -363,7 +601,8 @@ def main():
 
         # Generate combinations and split
         combinations = get_scrape_combinations(test_mode)
-    chunks = split_combinations(combinations, args.workers)
+    # --single-writer: one batch file; the scraper parallelizes it internally
+    chunks = split_combinations(combinations, 1 if args.single_writer else args.workers)
 
     print(f"Splitting {len(combinations)} combinations into {len(chunks)} batch files:")
     for i, chunk in enumerate(chunks, 1):
@@ -373,17 +612,26 @@ def main():
     batch_paths = write_batch_files(chunks, test_mode)
     print(f"\nBatch files written to {BATCH_DIR}/\n")
 
+    extra_flags = []
+    if args.with_reviews:
+        extra_flags.append("--with-reviews")
+    if args.export_db:
+        extra_flags.append("--export-db")
+    if args.no_headless:
+        extra_flags.append("--no-headless")
+
+    if args.single_writer:
+        cmd = single_writer_command(batch_paths[0], args.workers, extra_flags)
+        if args.run:
+            print(f"=== Launching 1 scraper with {args.workers} browser workers (writes to data/) ===")
+            sys.exit(subprocess.run(cmd).returncode)
+        print("To run manually (results go straight to data/, no merge needed):")
+        print(f"  {' '.join(cmd)}")
+        return
+
     # Optionally launch
     if args.run:
         print(f"=== Launching {len(batch_paths)} workers (isolated output dirs) ===")
-        extra_flags = []
-        if args.with_reviews:
-            extra_flags.append("--with-reviews")
-        if args.export_db:
-            extra_flags.append("--export-db")
-        if args.no_headless:
-            extra_flags.append("--no-headless")
-
         failed = launch_workers(batch_paths, extra_flags)
 
         if failed:
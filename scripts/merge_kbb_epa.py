@@ -17,6 +17,23 @@ DATA_DIR = Path(__file__).resolve().parent.parent / "data" / "csv"
 KBB_EPA_PATH = DATA_DIR / "all_cars.csv"
 EPA_PATH = DATA_DIR / "epa_alt_fuel_vehicles.csv"
 
+# Explicit dtypes for the columns whose type is known up front, so the CSV
+# parser does not infer them. The KBB measures are always float64: the EPA
+# rows appended by earlier runs leave them empty.
+KBB_DTYPES = {
+    "year": "Int16",
+    "price": "float64",
+    "hp": "float64",
+    "torque_lbft": "float64",
+    "cargo_cuft": "float64",
+}
+EPA_DTYPES = {"year": "Int16"}
+# Write buffer for the output CSV; to_csv emits many small chunks
+CSV_WRITE_BUFFER = 1 << 20
+# Low-cardinality string columns stored as categoricals before the concat,
+# so the final sort compares integer codes for make and fuel_type
+CATEGORY_COLS = ("make", "fuel_type", "Fuel Type", "Drivetrain", "data_source")
+
 # ---------------------------------------------------------------------------
 # Make-name normalization (EPA -> KBB convention)
 # ---------------------------------------------------------------------------
@@ -55,6 +72,11 @@ SERIES_MAP = {
 BMW_RE = re.compile(r"^(\d)")
 # Mercedes: leading letter(s) before digits (e.g. "C300" -> "C", "E350" -> "E", "S580" -> "S")
 MERC_RE = re.compile(r"^([A-Z]+)(?=\d)")
+# Series-key pattern per Tier 3 make
+SERIES_RE = {"BMW": BMW_RE, "Mercedes-Benz": MERC_RE}
+# Characters that may follow a KBB model name inside an EPA model name
+# ("" = end of string)
+WORD_BOUNDARY = ("", " ", "-", "/")
 
 
 def normalize_fuel(val):
@@ -69,85 +91,112 @@ def normalize_make(val):
     return MAKE_NORM.get(val, val)
 
 
-def extract_base_model(epa_model, kbb_models_for_make):
+def _share_categories(frames, cols):
+    """Cast each of *cols* to one sorted categorical dtype across *frames*.
+
+    A shared dtype keeps the column categorical through pd.concat, and
+    sorted categories make code order match string order for sorting.
+    """
+    for col in cols:
+        present = [df for df in frames if col in df.columns]
+        values = pd.concat([df[col] for df in present]).dropna().unique()
+        dtype = pd.CategoricalDtype(sorted(values))
+        for df in present:
+            df[col] = df[col].astype(dtype)
+
+
+def _norm_model(models):
+    """Lowercase and strip hyphens for matching ("CR-V" -> "crv")."""
+    return models.str.lower().str.replace("-", "", regex=False)
+
+
+def _grouped_slice_eq(df, len_col, text_col, prefix_col):
+    """Rowwise df[text_col][:n] == df[prefix_col], vectorized per distinct n."""
+    mask = pd.Series(False, index=df.index)
+    for n, grp in df.groupby(len_col):
+        mask[grp.index] = grp[text_col].str[:n] == grp[prefix_col]
+    return mask
+
+
+def _kbb_model_table(kbb_models):
+    """
+    Flatten {make: models} into one (brand, km, km_norm, km_len, km_norm_len)
+    table, normalized once and sorted longest model first.
+    """
+    table = pd.DataFrame(
+        [(make, km) for make, models_set in kbb_models.items() for km in models_set
+         if not pd.isna(km)],
+        columns=["brand", "km"],
+    )
+    table["km_norm"] = _norm_model(table["km"])
+    table["km_len"] = table["km"].str.len()
+    table["km_norm_len"] = table["km_norm"].str.len()
+    return table.sort_values("km_len", ascending=False, kind="stable", ignore_index=True)
+
+
+def resolve_base_models(epa, kbb_models):
     """
-    Tiered matching of an EPA model name to a KBB base model.
+    Vectorized tiered matching of EPA model names to KBB base models.
+
+    Tier 3 (series, BMW / Mercedes-Benz) is tried first, then Tier 1 (exact,
+    hyphen-normalized) and Tier 2 (longest prefix at a word boundary).
+    Rows that match nothing keep the EPA model (Tier 4).
 
     Args:
-        epa_model: EPA model string (e.g. "RAV4 Hybrid", "330e xDrive")
-        kbb_models_for_make: set of KBB model names for this make
+        epa: EPA DataFrame with make-normalized "brand" and "model" columns
+        kbb_models: {make: set of KBB model names}
 
     Returns:
-        matched KBB base model, or the EPA model as-is (Tier 4)
+        Series of base models aligned with epa.index
     """
-    if not kbb_models_for_make or pd.isna(epa_model):
-        return epa_model
+    models = epa["model"]
+    base = models.copy()
+    resolved = models.isna() | ~epa["brand"].isin(
+        [make for make, models_set in kbb_models.items() if models_set]
+    )
 
-    epa_lower = epa_model.lower().replace("-", "")
+    # Tier 3: series-based matching on the BMW / Mercedes-Benz rows, e.g.
+    # "330e" -> "3" -> "3-Series" when KBB lists that series for the make
+    for make, series_map in SERIES_MAP.items():
+        rows = epa.index[~resolved & (epa["brand"] == make)]
+        series = models[rows].str.extract(SERIES_RE[make], expand=False).map(series_map)
+        tier3 = series[series.notna() & series.isin(kbb_models.get(make, ()))]
+        base[tier3.index] = tier3
+        resolved[tier3.index] = True
+
+    # Candidate pairs: every pending EPA row x every KBB model of its make,
+    # longest KBB model first within each EPA row
+    pending = epa.index[~resolved]
+    cand = pd.DataFrame({
+        "epa_idx": pending,
+        "brand": epa.loc[pending, "brand"].to_numpy(),
+        "model": models[pending].to_numpy(),
+    })
+    cand["epa_norm"] = _norm_model(cand["model"])
+    cand = cand.merge(_kbb_model_table(kbb_models), on="brand")
 
     # Tier 1: exact match (hyphen-normalized)
-    for km in kbb_models_for_make:
-        if epa_lower == km.lower().replace("-", ""):
-            return km
-
-    # Tier 2: longest prefix match
-    best_match = None
-    best_len = 0
-    for km in kbb_models_for_make:
-        km_lower = km.lower().replace("-", "")
-        # EPA model must start with KBB model name (word boundary)
-        if epa_lower.startswith(km_lower):
-            # Ensure match is at a word boundary (next char is space, end, or non-alpha for short models)
-            rest = epa_model[len(km):]
-            if rest == "" or rest[0] in (" ", "-", "/"):
-                if len(km) > best_len:
-                    best_len = len(km)
-                    best_match = km
-    if best_match:
-        return best_match
-
-    # Tier 2b: try without hyphen normalization on epa side too
-    for km in kbb_models_for_make:
-        if epa_model.startswith(km):
-            rest = epa_model[len(km):]
-            if rest == "" or rest[0] in (" ", "-", "/"):
-                if len(km) > best_len:
-                    best_len = len(km)
-                    best_match = km
-    if best_match:
-        return best_match
-
-    # Tier 4 (no match): return EPA model as-is
-    return epa_model
-
-
-def extract_series_model(make, epa_model, kbb_models_for_make):
-    """Tier 3: series-based matching for BMW / Mercedes-Benz."""
-    series_map = SERIES_MAP.get(make)
-    if not series_map:
-        return None
-
-    if make == "BMW":
-        m = BMW_RE.match(epa_model)
-        if m:
-            digit = m.group(1)
-            series = series_map.get(digit)
-            if series and series in kbb_models_for_make:
-                return series
-        # Also check direct KBB model matches (X1, X3, i3, i4, iX, Z4, M3, etc.)
-        return None
-
-    if make == "Mercedes-Benz":
-        m = MERC_RE.match(epa_model)
-        if m:
-            prefix = m.group(1)
-            series = series_map.get(prefix)
-            if series and series in kbb_models_for_make:
-                return series
-        # Direct matches (GLA, GLC, GLE, GLS, GLB, CLA, CLS, SL, SLK)
-        return None
-
-    return None
+    exact = cand[cand["epa_norm"] == cand["km_norm"]].drop_duplicates("epa_idx")
+    cand = cand[~cand["epa_idx"].isin(exact["epa_idx"])]
+
+    # EPA model must continue at a word boundary after the KBB model name
+    next_char = pd.Series("", index=cand.index)
+    for n, grp in cand.groupby("km_len"):
+        next_char[grp.index] = grp["model"].str[n:n + 1]
+    at_boundary = next_char.isin(WORD_BOUNDARY)
+
+    # Tier 2: longest prefix match (the first hit per EPA row is the longest)
+    prefix = cand[
+        at_boundary & _grouped_slice_eq(cand, "km_norm_len", "epa_norm", "km_norm")
+    ].drop_duplicates("epa_idx")
+
+    # (A raw, un-normalized prefix match needs no tier of its own: lowercasing
+    # and dropping hyphens preserve prefixes, so Tier 2 already covers it.)
+    for tier in (exact, prefix):
+        base[tier["epa_idx"].to_numpy()] = tier["km"].to_numpy()
+
+    # Tier 4 (no match): EPA model as-is
+    return base
 
 
 def main():
@@ -158,7 +207,7 @@ def main():
     # ------------------------------------------------------------------
     # Step 1: Load and restore original KBB data
     # ------------------------------------------------------------------
-    raw = pd.read_csv(KBB_EPA_PATH, low_memory=False)
+    raw = pd.read_csv(KBB_EPA_PATH, dtype=KBB_DTYPES, low_memory=False)
     print(f"\nLoaded all_cars.csv: {len(raw)} rows")
 
     # Identify true KBB rows. KBB rows always have at least one KBB-specific
@@ -166,26 +215,27 @@ def main():
     # have NaN for all of them. This is robust across re-runs.
     KBB_ONLY_COLS = ["bodytype", "price", "hp", "torque_lbft", "cargo_cuft"]
     kbb_only_present = [c for c in KBB_ONLY_COLS if c in raw.columns]
-    has_kbb_data = ~raw[kbb_only_present].isna().all(axis=1)
+    has_kbb_data = raw[kbb_only_present].notna().to_numpy().any(axis=1)
 
+    # No .copy() on the filtered frames: with copy-on-write (always on in
+    # pandas 3) the column writes below cannot leak back into raw or epa
     if "data_source" in raw.columns:
         # Use KBB-specific columns to catch mislabeled rows from prior runs
-        kbb = raw[has_kbb_data].copy()
+        kbb = raw[has_kbb_data]
     else:
         # First run: original file has null-trim EPA rows from naive concat
-        kbb = raw[raw["trim"].notna()].copy()
+        kbb = raw[raw["trim"].notna()]
     print(f"KBB rows: {len(kbb)}")
 
     # Drop columns that will be re-populated by the merge
-    for col in ["engine_cylinders", "engine_volume", "extra_tech",
-                "fuel_type", "base_model", "data_source"]:
-        if col in kbb.columns:
-            kbb.drop(columns=[col], inplace=True)
+    kbb = kbb.drop(columns=["engine_cylinders", "engine_volume", "extra_tech",
+                            "fuel_type", "base_model", "data_source"],
+                   errors="ignore")
 
     # ------------------------------------------------------------------
     # Step 2: Load EPA data
     # ------------------------------------------------------------------
-    epa = pd.read_csv(EPA_PATH)
+    epa = pd.read_csv(EPA_PATH, dtype=EPA_DTYPES)
     print(f"EPA rows: {len(epa)}")
 
     # ------------------------------------------------------------------
@@ -197,29 +247,17 @@ def main():
     # ------------------------------------------------------------------
     # Build KBB model lookup: {make: set(models)}
     # ------------------------------------------------------------------
-    kbb_models = {}
-    for make in kbb["make"].unique():
-        kbb_models[make] = set(kbb[kbb["make"] == make]["model"].unique())
+    kbb_models = {
+        make: set(models)
+        for make, models in kbb.groupby("make")["model"].unique().items()
+    }
 
     # ------------------------------------------------------------------
     # Step 3: Normalize EPA makes and extract base_model
     # ------------------------------------------------------------------
     epa["brand"] = epa["brand"].apply(normalize_make)
 
-    base_models = []
-    for _, row in epa.iterrows():
-        make = row["brand"]
-        model = row["model"]
-        models_set = kbb_models.get(make, set())
-
-        # Try Tier 3 (series) first for BMW/Mercedes, then fall through to general
-        series_match = extract_series_model(make, model, models_set)
-        if series_match:
-            base_models.append(series_match)
-        else:
-            base_models.append(extract_base_model(model, models_set))
-
-    epa["base_model"] = base_models
+    epa["base_model"] = resolve_base_models(epa, kbb_models)
 
     # ------------------------------------------------------------------
     # Step 4: Classify and merge
@@ -229,33 +267,23 @@ def main():
     kbb["base_model"] = kbb["model"]
     kbb["data_source"] = "kbb"
 
-    # Key sets for matching
-    kbb_keys_full = set(
-        zip(kbb["make"], kbb["model"], kbb["year"], kbb["fuel_type"])
-    )
-    kbb_keys_model = set(
-        zip(kbb["make"], kbb["model"], kbb["year"])
-    )
-
-    cat_a = []  # skip
-    cat_b = []  # new powertrain variant
-    cat_c = []  # EPA-only vehicle
+    # Classify with merge indicators instead of per-row key lookups
+    key_cols = ["make", "model", "year", "fuel_type"]
+    epa_keys = epa[["brand", "base_model", "year", "fuel_type"]].set_axis(key_cols, axis=1)
 
-    for idx, row in epa.iterrows():
-        make = row["brand"]
-        bm = row["base_model"]
-        year = row["year"]
-        fuel = row["fuel_type"]
+    def in_kbb(cols):
+        """Boolean array: does each EPA row's key on *cols* exist in KBB?"""
+        matched = epa_keys[cols].merge(
+            kbb[cols].drop_duplicates(), on=cols, how="left", indicator=True
+        )
+        return (matched["_merge"] == "both").to_numpy()
 
-        key_full = (make, bm, year, fuel)
-        key_model = (make, bm, year)
+    in_full = in_kbb(key_cols)
+    in_model = in_kbb(key_cols[:3])
 
-        if key_full in kbb_keys_full:
-            cat_a.append(idx)
-        elif key_model in kbb_keys_model:
-            cat_b.append(idx)
-        else:
-            cat_c.append(idx)
+    cat_a = epa.index[in_full]               # skip
+    cat_b = epa.index[~in_full & in_model]   # new powertrain variant
+    cat_c = epa.index[~in_full & ~in_model]  # EPA-only vehicle
 
     print(f"\nMerge classification:")
     print(f"  Category A (skip, already in KBB): {len(cat_a)}")
@@ -265,31 +293,34 @@ def main():
     # ------------------------------------------------------------------
     # Build EPA rows to append (Category B + C)
     # ------------------------------------------------------------------
-    epa_append = epa.loc[cat_b + cat_c].copy()
+    epa_append = epa.loc[cat_b.append(cat_c)]
     print(f"  EPA rows to append: {len(epa_append)}")
 
-    # Map EPA columns to unified schema
-    epa_unified = pd.DataFrame()
-    epa_unified["make"] = epa_append["brand"]
-    epa_unified["model"] = epa_append["base_model"]
-    epa_unified["year"] = epa_append["year"]
-    epa_unified["trim"] = epa_append["model"]  # Full EPA model name as trim
-    epa_unified["Fuel Type"] = epa_append["fuel_type"]
-    epa_unified["fuel_type"] = epa_append["fuel_type"]
-    epa_unified["mpg_city"] = epa_append["mpg_city"]
-    epa_unified["mpg_hwy"] = epa_append["mpg_hwy"]
-    epa_unified["mpg_comb"] = epa_append["mpg_comb"]
-    epa_unified["Drivetrain"] = epa_append["drivetrain"]
-    epa_unified["Engine"] = epa_append["engine"]
-    epa_unified["engine_cylinders"] = epa_append["engine_cylinders"]
-    epa_unified["engine_volume"] = epa_append["engine_volume"]
-    epa_unified["extra_tech"] = epa_append["extra_tech"]
-    epa_unified["base_model"] = epa_append["base_model"]
-    epa_unified["data_source"] = "epa"
+    # Map EPA columns to unified schema (one constructor call; the source
+    # Series share epa_append's index, so nothing has to be realigned)
+    epa_unified = pd.DataFrame({
+        "make": epa_append["brand"],
+        "model": epa_append["base_model"],
+        "year": epa_append["year"],
+        "trim": epa_append["model"],  # Full EPA model name as trim
+        "Fuel Type": epa_append["fuel_type"],
+        "fuel_type": epa_append["fuel_type"],
+        "mpg_city": epa_append["mpg_city"],
+        "mpg_hwy": epa_append["mpg_hwy"],
+        "mpg_comb": epa_append["mpg_comb"],
+        "Drivetrain": epa_append["drivetrain"],
+        "Engine": epa_append["engine"],
+        "engine_cylinders": epa_append["engine_cylinders"],
+        "engine_volume": epa_append["engine_volume"],
+        "extra_tech": epa_append["extra_tech"],
+        "base_model": epa_append["base_model"],
+        "data_source": "epa",
+    })
 
     # ------------------------------------------------------------------
     # Step 5: Concat and output
     # ------------------------------------------------------------------
+    _share_categories([kbb, epa_unified], CATEGORY_COLS)
     merged = pd.concat([kbb, epa_unified], ignore_index=True)
 
     # Sort by (year, make, base_model, fuel_type, trim)
@@ -329,7 +360,9 @@ def main():
     print(rav4[["make", "model", "year", "trim", "Fuel Type", "data_source"]].to_string())
 
     # Write output
-    merged.to_csv(KBB_EPA_PATH, index=False)
+    with open(KBB_EPA_PATH, "w", encoding="utf-8", newline="",
+              buffering=CSV_WRITE_BUFFER) as f:
+        merged.to_csv(f, index=False)
     print(f"\nWrote {len(merged)} rows to {KBB_EPA_PATH}")
     print("Done!")
 
@@ -0,0 +1,20 @@
+"""Door-count tab names resolve through the keyword mapping alone."""
+import pytest
+
+from kbb_scraper.scrapers.bodytype_detector import BodyTypeDetector
+
+
+@pytest.mark.parametrize("tab_name, expected", [
+    ("4D Sedan", "sedan"),
+    ("2-Door Coupe", "coupe"),
+    ("5 Door Hatchback", "hatchback"),
+    # Door count alone, once handled by the removed regex fallback
+    ("4D", "sedan"),
+    ("4 Door", "sedan"),
+    ("2D", "coupe"),
+    ("2-door", "coupe"),
+    ("5D", "hatchback"),
+    ("5-Door", "hatchback"),
+])
+def test_door_count_tabs(tab_name, expected):
+    assert BodyTypeDetector().detect_body_type(tab_name) == expected
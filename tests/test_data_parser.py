@@ -0,0 +1,63 @@
+"""KBBDataParser (lxml) against BeautifulSoup's get_text on a golden spec table."""
+from pathlib import Path
+
+import pytest
+from bs4 import BeautifulSoup
+from lxml import etree
+
+from kbb_scraper.parsers.data_parser import KBBDataParser
+from kbb_scraper.utils.helpers import element_text
+
+FIXTURE = Path(__file__).parent / "fixtures" / "spec_table.html"
+
+
+@pytest.fixture(scope="module")
+def table_html():
+    return FIXTURE.read_text(encoding="utf-8")
+
+
+def _bs4_parse(table_html):
+    """The BeautifulSoup row loop KBBDataParser.parse_table_data replaced."""
+    parser = KBBDataParser()
+    soup = BeautifulSoup(table_html, "lxml")
+    trim_names = []
+    for th in soup.select("#compare-trim-tables thead tr th")[2:]:
+        text = " ".join(th.get_text(" ", strip=True).split())
+        if text and "See Pricing" not in text and "See Cars" not in text:
+            trim_names.append(text)
+
+    specs = []
+    for row in soup.select("tbody tr"):
+        cells = row.find_all("td")
+        if len(cells) < 3:
+            continue
+        values = [parser._clean_value(c.get_text(strip=True)) for c in cells[2:]]
+        values = (values + [""] * len(trim_names))[:len(trim_names)]
+        specs.append((parser._clean_spec_name(cells[1].get_text(strip=True)), values))
+    return specs, trim_names
+
+
+@pytest.mark.parametrize("separator", ["", " "])
+def test_element_text_matches_bs4_get_text(table_html, separator):
+    tree = etree.HTML(table_html)
+    soup = BeautifulSoup(table_html, "lxml")
+    for tag in ("th", "td"):
+        expected = [c.get_text(separator, strip=True) for c in soup.find_all(tag)]
+        assert [element_text(c, separator) for c in tree.iter(tag)] == expected
+
+
+def test_parse_table_data_matches_bs4(table_html):
+    parsed, trim_names = KBBDataParser().parse_table_data(table_html)
+    expected_specs, expected_trims = _bs4_parse(table_html)
+
+    assert trim_names == expected_trims
+    assert [(p["spec_name"], p["values"]) for p in parsed] == expected_specs
+
+
+def test_parse_table_data_skips_script_style_template(table_html):
+    parsed, trim_names = KBBDataParser().parse_table_data(table_html)
+    values = {p["spec_name"]: p["values"] for p in parsed}
+
+    assert trim_names == ["LE Sedan", "XSE V6"]
+    assert values["Engine"] == ["2.5L I4", "V6"]
+    assert values["Fuel Economy"] == ["28 City / 39 Hwy", ""]
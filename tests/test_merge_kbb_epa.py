@@ -0,0 +1,63 @@
+"""Tiered base-model resolution in scripts/merge_kbb_epa.py."""
+import pandas as pd
+import pytest
+
+from merge_kbb_epa import resolve_base_models
+
+KBB_MODELS = {
+    "BMW": {"3-Series", "5-Series", "X5", "i4", "M3"},
+    "Mercedes-Benz": {"C-Class", "S-Class", "GLE", "GLC"},
+    "Toyota": {"RAV4", "Corolla", "Corolla-Cross", "Camry"},
+    "Honda": {"CR-V"},
+}
+
+# (brand, EPA model, expected base model), as resolved by the original
+# per-row extract_series_model / extract_base_model
+CASES = [
+    # Tier 3: BMW series digit, Mercedes class letter
+    ("BMW", "330e", "3-Series"),
+    ("BMW", "530e xDrive", "5-Series"),
+    ("BMW", "745e xDrive", "745e xDrive"),  # no 7-Series in KBB
+    ("BMW", "X5 xDrive45e", "X5"),
+    ("BMW", "i4 eDrive40", "i4"),
+    ("BMW", "M340i", "M340i"),  # "M3" is not followed by a word boundary
+    ("BMW", "M3", "M3"),
+    ("Mercedes-Benz", "C300", "C-Class"),
+    ("Mercedes-Benz", "S580e 4MATIC", "S-Class"),
+    ("Mercedes-Benz", "E350", "E350"),  # no E-Class in KBB
+    ("Mercedes-Benz", "GLE 450e", "GLE"),
+    ("Mercedes-Benz", "GLC350e", "GLC350e"),
+    # Tier 1 / Tier 2: exact and longest word-boundary prefix
+    ("Toyota", "RAV4", "RAV4"),
+    ("Toyota", "RAV4 Hybrid", "RAV4"),
+    ("Toyota", "RAV4 Prime", "RAV4"),
+    ("Toyota", "RAV4Prime", "RAV4Prime"),
+    ("Toyota", "rav4 hybrid", "RAV4"),
+    ("Toyota", "Corolla Cross Hybrid", "Corolla"),
+    ("Toyota", "Corolla-Cross Hybrid", "Corolla-Cross"),
+    ("Toyota", "Corolla/Cross", "Corolla"),
+    ("Toyota", "Camry-Hybrid", "Camry"),
+    ("Honda", "CRV", "CR-V"),
+    ("Honda", "CR-V Hybrid", "CR-V"),
+    # Tier 4: make not in KBB
+    ("Tesla", "Model 3", "Model 3"),
+]
+
+
+@pytest.fixture(scope="module")
+def resolved():
+    epa = pd.DataFrame([(brand, model) for brand, model, _ in CASES],
+                       columns=["brand", "model"])
+    return resolve_base_models(epa, KBB_MODELS)
+
+
+@pytest.mark.parametrize("i", range(len(CASES)),
+                         ids=[f"{brand}-{model}" for brand, model, _ in CASES])
+def test_resolve_base_models(resolved, i):
+    assert resolved[i] == CASES[i][2]
+
+
+def test_resolve_base_models_keeps_index():
+    epa = pd.DataFrame({"brand": ["Toyota", "BMW"], "model": ["RAV4 Hybrid", "330e"]},
+                       index=[10, 3])
+    assert resolve_base_models(epa, KBB_MODELS).to_dict() == {10: "RAV4", 3: "3-Series"}